@@ -35,6 +35,11 @@ def get_profile_service() -> ExtraordinaryProfileService:
     
     return profile_service
 
+async def close_profile_service():
+    """Close the profile service's HTTP connections, if it was started"""
+    if profile_service is not None:
+        await profile_service.close()
+
 class ProfileResponse(BaseModel):
     profile: ExtraordinaryProfile
     generation_time_seconds: Optional[float] = None
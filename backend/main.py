@@ -1,5 +1,6 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import os
@@ -11,10 +12,11 @@ from services.data_ingestion import DataIngestionService
 from services.llm_service import LLMService
 from services.graph_service import GraphService
 from services.logo_service import LogoService
+from services.exa_service import ExaService
 from api.exa_routes import router as exa_router
 from api.ma_agent_routes import router as ma_agent_router
 from api.extraordinary_routes import router as extraordinary_router
-from api.extraordinary_profile_routes import router as extraordinary_profile_router
+from api.extraordinary_profile_routes import router as extraordinary_profile_router, close_profile_service
 from api.impact_simulation_routes import router as impact_simulation_router
 from api.vector_search_routes import router as vector_search_router
 from models.schemas import (
@@ -24,7 +26,7 @@ from models.schemas import (
 
 load_dotenv()
 
-app = FastAPI(title="DealFlow API", version="1.0.0")
+app = FastAPI(title="DealFlow API", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -48,6 +50,12 @@ app.include_router(extraordinary_profile_router)
 app.include_router(impact_simulation_router)
 app.include_router(vector_search_router)
 
+@app.on_event("shutdown")
+async def shutdown():
+    await data_service.close()
+    await ExaService.close_shared()
+    await close_profile_service()
+
 @app.get("/")
 async def root():
     return {"message": "DealFlow API is running"}
@@ -181,6 +181,8 @@ async def demonstrate_deep_research():
     except Exception as e:
         print(f"\n❌ Error during research: {e}")
         logger.error(f"Research error: {e}", exc_info=True)
+    finally:
+        await service.close()
 
 if __name__ == "__main__":
     asyncio.run(demonstrate_deep_research())
@@ -75,15 +75,14 @@ class DataEnrichmentService:
         enriched_data = cached_data.copy()
         
         if companies_to_enrich:
-            async with ExaService() as exa:
-                batch_results = await exa.enrich_company_batch(companies_to_enrich)
-                
-                for company_name, result in batch_results.items():
-                    if "error" not in result:
-                        enriched_data[company_name] = result.get('exa_data', {})
-                        enriched_data[company_name]['last_updated'] = datetime.now().isoformat()
-                    else:
-                        logger.warning(f"Failed to enrich {company_name}: {result['error']}")
+            batch_results = await ExaService.shared().enrich_company_batch(companies_to_enrich)
+            
+            for company_name, result in batch_results.items():
+                if "error" not in result:
+                    enriched_data[company_name] = result.get('exa_data', {})
+                    enriched_data[company_name]['last_updated'] = datetime.now().isoformat()
+                else:
+                    logger.warning(f"Failed to enrich {company_name}: {result['error']}")
         
         # Save updated cache
         self.save_cached_data(enriched_data)
@@ -118,13 +117,12 @@ class DataEnrichmentService:
         
         # If no cached data or data is old, fetch fresh data
         if not exa_data or self._is_data_stale(exa_data):
-            async with ExaService() as exa:
-                fresh_result = await exa.search_company(company_name)
-                if "error" not in fresh_result:
-                    exa_data = fresh_result.get('exa_data', {})
-                    # Update cache
-                    cached_data[company_name] = exa_data
-                    self.save_cached_data(cached_data)
+            fresh_result = await ExaService.shared().search_company(company_name)
+            if "error" not in fresh_result:
+                exa_data = fresh_result.get('exa_data', {})
+                # Update cache
+                cached_data[company_name] = exa_data
+                self.save_cached_data(cached_data)
         
         # Combine data
         profile = {
@@ -1,28 +1,91 @@
 import asyncio
 import aiohttp
 import yfinance as yf
-from newsapi import NewsApiClient
 import pandas as pd
 from datetime import datetime, timedelta
 import requests
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Union
 import json
 import os
 import csv
+import re
+import sys
 from models.schemas import Company, Deal, NewsData, DealType, CompanyProfile
 import pandas as pd
 import random
 import uuid
+from collections import OrderedDict, defaultdict
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Deal-type keywords in priority order; the first type with a keyword anywhere in the
+# text wins. Keywords match as substrings ("acquirer", "reinvest" and "rebuys" count)
+_DEAL_TYPE_KEYWORDS = (
+    (DealType.ACQUISITION, ("acquire", "acquisition", "buys", "purchased")),
+    (DealType.MERGER, ("merge", "merger")),
+    (DealType.PARTNERSHIP, ("partner", "partnership", "collaborate")),
+    (DealType.INVESTMENT, ("invest", "investment", "funding", "round")),
+)
+
+# Highlights shown on the profile of companies with extraordinary_score > 0.8
+_EXTRAORDINARY_FACTORS = ("AI Leadership", "Market Innovation", "Strong Partnerships")
+
+# Keyword -> priority index into _DEAL_TYPE_KEYWORDS (lower wins)
+_KEYWORD_PRIORITY = {
+    keyword: priority
+    for priority, (_, keywords) in enumerate(_DEAL_TYPE_KEYWORDS)
+    for keyword in keywords
+}
+
+# Every keyword occurrence in one pass: the zero-width lookahead is tried at each
+# position, so overlapping occurrences are all seen; alternatives are in priority
+# order, so each position reports its highest-priority keyword
+_DEAL_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword in _KEYWORD_PRIORITY) + "))"
+)
 
 class DataIngestionService:
     def __init__(self):
         self.newsapi_key = os.getenv("NEWSAPI_KEY")
-        self.newsapi = NewsApiClient(api_key=self.newsapi_key) if self.newsapi_key else None
+        self.newsapi_url = "https://newsapi.org/v2/everything"
+        self._newsapi_semaphore = asyncio.Semaphore(10)
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # In-flight NewsAPI requests keyed by (query, from_date), shared by concurrent callers
+        self._newsapi_inflight: Dict[Tuple[str, str], asyncio.Future] = {}
         
         # In-memory storage for demo (replace with database in production)
         self.companies_db = {}
         self.deals_db = {}
         
+        # Lowercased company name -> company id, kept in sync with companies_db
+        self._name_lower_to_id: Dict[str, str] = {}
+        
+        # Company id -> insertion sequence number, matching companies_db's iteration order
+        self._company_seq: Dict[str, int] = {}
+        self._next_company_seq = 0
+        
+        # Company id -> (extraordinary_score they were computed from, extraordinary factors)
+        self._extraordinary_factors: Dict[str, Tuple[Optional[float], Tuple[str, ...]]] = {}
+        
+        # Company id -> ids of deals where it is source or target
+        self._deals_by_company: Dict[str, List[str]] = defaultdict(list)
+        
+        # Bumped on every store mutation; cached profiles are keyed by it
+        self._db_version = 0
+        self._profile_cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+        self._profile_cache_size = 1024
+        
+        # Snapshot lists returned by get_companies/get_deals, reset on mutation
+        self._companies_cache: Optional[List[Company]] = None
+        self._deals_cache: Optional[List[Deal]] = None
+        
+        # Multi-pattern matcher over lowercased company names (rebuilt lazily)
+        self._name_matcher = None
+        
         # Initialize with some sample data
         self._initialize_sample_data()
     
@@ -87,8 +150,9 @@ class DataIngestionService:
         ]
         
         for company_data in sample_companies:
-            company = Company(**company_data)
-            self.companies_db[company.id] = company
+            self.add_company(Company(**company_data))
+        
+        self._build_name_matcher()
         
         # Sample deals
         sample_deals = [
@@ -119,38 +183,102 @@ class DataIngestionService:
         ]
         
         for deal_data in sample_deals:
-            deal = Deal(**deal_data)
-            self.deals_db[deal.id] = deal
+            self.add_deal(Deal(**deal_data))
+
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use"""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        return self._http_session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
 
-    async def fetch_news(self, query: str, days_back: int = 30) -> List[NewsData]:
+    async def _fetch_newsapi_articles(self, query: str, from_date: str) -> Dict[str, Any]:
+        """Run one NewsAPI query, joining an identical request already in flight"""
+        key = (query, from_date)
+        future = self._newsapi_inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request_newsapi(query, from_date))
+            self._newsapi_inflight[key] = future
+            future.add_done_callback(lambda _: self._newsapi_inflight.pop(key, None))
+        
+        # shield() so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(future)
+
+    async def _request_newsapi(self, query: str, from_date: str) -> Dict[str, Any]:
+        """Run one NewsAPI query over the shared HTTP session"""
+        params = {
+            'q': query,
+            'apiKey': self.newsapi_key,
+            'from': from_date,
+            'language': 'en',
+            'sortBy': 'relevancy',
+            'pageSize': 50
+        }
+        
+        async with self._newsapi_semaphore:
+            session = await self._get_http_session()
+            async with session.get(self.newsapi_url, params=params) as response:
+                data = await response.json()
+        
+        if data.get('status') != 'ok':
+            raise RuntimeError(f"{data.get('code')}: {data.get('message')}")
+        return data
+
+    async def fetch_news(self, queries: Union[str, List[str]], days_back: int = 30) -> List[NewsData]:
         """Fetch M&A news from various sources"""
+        if isinstance(queries, str):
+            queries = [queries]
+        
         news_data = []
+        now = datetime.now()
         
-        # NewsAPI integration
-        if self.newsapi:
-            try:
-                from_date = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
-                
-                articles = self.newsapi.get_everything(
-                    q=query,
-                    from_param=from_date,
-                    language='en',
-                    sort_by='relevancy',
-                    page_size=50
-                )
+        # NewsAPI integration - queries run concurrently, bounded by the semaphore
+        if self.newsapi_key:
+            from_date = (now - timedelta(days=days_back)).strftime('%Y-%m-%d')
+            results = await asyncio.gather(
+                *(self._fetch_newsapi_articles(query, from_date) for query in queries),
+                return_exceptions=True
+            )
+            
+            seen_urls = set()
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"NewsAPI error: {result}")
+                    continue
                 
-                for article in articles.get('articles', []):
-                    news_item = NewsData(
-                        title=article['title'],
-                        content=article['description'] or "",
-                        source=article['source']['name'],
-                        published_date=datetime.fromisoformat(article['publishedAt'].replace('Z', '+00:00')),
-                        url=article['url'],
-                        companies_mentioned=self._extract_companies_from_text(article['title'] + " " + (article['description'] or ""))
-                    )
-                    news_data.append(news_item)
-            except Exception as e:
-                print(f"NewsAPI error: {e}")
+                try:
+                    articles = result.get('articles', [])
+                    
+                    # Parse the whole page of timestamps in one vectorized call
+                    published_dates = pd.to_datetime(
+                        [article['publishedAt'] for article in articles],
+                        utc=True,
+                        format='ISO8601',
+                        errors='coerce'
+                    ).to_pydatetime()
+                    
+                    for article, published_date in zip(articles, published_dates):
+                        # Overlapping queries return the same article more than once
+                        if article['url'] in seen_urls or pd.isna(published_date):
+                            continue
+                        seen_urls.add(article['url'])
+                        
+                        news_item = NewsData(
+                            title=article['title'],
+                            content=article['description'] or "",
+                            source=sys.intern(article['source']['name'] or ""),
+                            published_date=published_date,
+                            url=article['url'],
+                            companies_mentioned=self._extract_companies_from_text(article['title'] + " " + (article['description'] or ""))
+                        )
+                        news_data.append(news_item)
+                except Exception as e:
+                    print(f"NewsAPI error: {e}")
         
         # Add some mock news data for demo
         mock_news = [
@@ -158,7 +286,7 @@ class DataIngestionService:
                 title="Epic Games and Sony Announce Strategic Partnership",
                 content="Epic Games and Sony have announced a new strategic partnership to develop next-generation gaming experiences.",
                 source="TechCrunch",
-                published_date=datetime.now() - timedelta(days=5),
+                published_date=now - timedelta(days=5),
                 url="https://techcrunch.com/mock-article",
                 companies_mentioned=["Epic Games", "Sony"]
             ),
@@ -166,7 +294,7 @@ class DataIngestionService:
                 title="Salesforce Acquires AI Startup for $2.1B",
                 content="Salesforce has completed the acquisition of an AI startup specializing in customer analytics.",
                 source="Reuters",
-                published_date=datetime.now() - timedelta(days=10),
+                published_date=now - timedelta(days=10),
                 url="https://reuters.com/mock-article",
                 companies_mentioned=["Salesforce"]
             )
@@ -175,38 +303,75 @@ class DataIngestionService:
         news_data.extend(mock_news)
         return news_data
 
+    def _build_name_matcher(self):
+        """Build a single-pass matcher over all known company names"""
+        if not self._name_lower_to_id:
+            self._name_matcher = None
+            return
+        
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for name_lower, company_id in self._name_lower_to_id.items():
+                automaton.add_word(name_lower, (company_id, self.companies_db[company_id].name))
+            automaton.make_automaton()
+            self._name_matcher = automaton
+        else:
+            # Names are checked one by one: a single regex alternation can't report a name
+            # nested in a longer one ("meta" in "metaplex"), which the automaton does
+            self._name_matcher = tuple(self._name_lower_to_id.items())
+
     def _extract_companies_from_text(self, text: str) -> List[str]:
         """Extract company names from text using simple pattern matching"""
         # This is a simplified version - in production, use NER models
-        known_companies = list(self.companies_db.keys())
-        mentioned = []
+        if self._name_matcher is None:
+            self._build_name_matcher()
+        if self._name_matcher is None:
+            return []
         
-        for company_id in known_companies:
-            company_name = self.companies_db[company_id].name
-            if company_name.lower() in text.lower():
-                mentioned.append(company_name)
+        text_lower = text.lower()
+        if AHOCORASICK_AVAILABLE:
+            mentioned_ids = {company_id for _, (company_id, _) in self._name_matcher.iter(text_lower)}
+        else:
+            mentioned_ids = {
+                company_id
+                for name_lower, company_id in self._name_matcher
+                if name_lower in text_lower
+            }
         
-        return mentioned
+        # Report mentions in companies_db order, not text order: process_news_to_deals
+        # takes the first two as the deal's source and target
+        return [
+            self.companies_db[company_id].name
+            for company_id in sorted(mentioned_ids, key=self._company_seq.__getitem__)
+        ]
+
+    def _classify_deal_type(self, text: str) -> Optional[DealType]:
+        """Classify a news text into a deal type from its keywords"""
+        best = len(_DEAL_TYPE_KEYWORDS)
+        
+        # One pass over the keyword occurrences with a table lookup each; stop at a top-priority hit
+        for match in _DEAL_KEYWORD_RE.finditer(text.lower()):
+            priority = _KEYWORD_PRIORITY[match.group(1)]
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+        
+        return _DEAL_TYPE_KEYWORDS[best][0] if best < len(_DEAL_TYPE_KEYWORDS) else None
 
     async def process_news_to_deals(self, news_data: List[NewsData]) -> List[Deal]:
         """Process news articles to extract potential deals"""
         deals = []
         
         for news in news_data:
-            # Simple keyword-based deal extraction
-            text = (news.title + " " + news.content).lower()
+            # A deal needs two parties, so skip classifying anything with fewer
+            if len(news.companies_mentioned) < 2:
+                continue
             
-            deal_type = None
-            if any(word in text for word in ["acquire", "acquisition", "buys", "purchased"]):
-                deal_type = DealType.ACQUISITION
-            elif any(word in text for word in ["merge", "merger"]):
-                deal_type = DealType.MERGER
-            elif any(word in text for word in ["partner", "partnership", "collaborate"]):
-                deal_type = DealType.PARTNERSHIP
-            elif any(word in text for word in ["invest", "investment", "funding", "round"]):
-                deal_type = DealType.INVESTMENT
+            # Simple keyword-based deal extraction
+            deal_type = self._classify_deal_type(news.title + " " + news.content)
             
-            if deal_type and len(news.companies_mentioned) >= 2:
+            if deal_type:
                 deal_id = f"extracted_{len(deals)}"
                 deal = Deal(
                     id=deal_id,
@@ -220,39 +385,45 @@ class DataIngestionService:
                     is_predicted=False
                 )
                 deals.append(deal)
-                self.deals_db[deal.id] = deal
+                self.add_deal(deal)
         
         return deals
 
     async def get_companies(self) -> List[Company]:
         """Get all companies"""
-        return list(self.companies_db.values())
+        if self._companies_cache is None:
+            self._companies_cache = list(self.companies_db.values())
+        return self._companies_cache
 
     async def get_deals(self) -> List[Deal]:
         """Get all deals"""
-        return list(self.deals_db.values())
+        if self._deals_cache is None:
+            self._deals_cache = list(self.deals_db.values())
+        return self._deals_cache
 
     async def get_company_profile(self, company_name: str) -> Dict[str, Any]:
         """Get detailed company profile"""
-        company_id = company_name.lower().replace(" ", "_")
+        company_name_lower = company_name.lower()
+        company_id = company_name_lower.replace(" ", "_")
         
         if company_id not in self.companies_db:
             # Try to find by name
-            for cid, company in self.companies_db.items():
-                if company.name.lower() == company_name.lower():
-                    company_id = cid
-                    break
+            company_id = self._name_lower_to_id.get(company_name_lower, company_id)
         
         if company_id not in self.companies_db:
             raise ValueError(f"Company {company_name} not found")
         
         company = self.companies_db[company_id]
         
+        cache_key = (company_id, self._db_version)
+        cached = self._profile_cache.get(cache_key)
+        if cached is not None:
+            self._profile_cache.move_to_end(cache_key)
+            return self._copy_profile(cached, company)
+        
+        
         # Get related deals
-        related_deals = [
-            deal for deal in self.deals_db.values()
-            if deal.source_company_id == company_id or deal.target_company_id == company_id
-        ]
+        related_deals = self.get_deals_for_company(company_id)
         
         # Mock financial data
         financial_metrics = {
@@ -262,12 +433,28 @@ class DataIngestionService:
             "current_ratio": 2.1
         }
         
-        return {
+        profile = {
             "company": company,
             "connections": related_deals,
             "financial_metrics": financial_metrics,
             "news_sentiment": 0.75,
-            "extraordinary_factors": ["AI Leadership", "Market Innovation", "Strong Partnerships"] if company.extraordinary_score and company.extraordinary_score > 0.8 else []
+            "extraordinary_factors": self._get_extraordinary_factors(company)
+        }
+        
+        self._profile_cache[cache_key] = profile
+        if len(self._profile_cache) > self._profile_cache_size:
+            self._profile_cache.popitem(last=False)
+        
+        return self._copy_profile(profile, company)
+
+    def _copy_profile(self, profile: Dict[str, Any], company: Company) -> Dict[str, Any]:
+        """Copy of a cached profile that the caller may change without touching the cache"""
+        return {
+            **profile,
+            "connections": list(profile["connections"]),
+            "financial_metrics": dict(profile["financial_metrics"]),
+            # Re-derived on every call, as the company may have been changed in place
+            "extraordinary_factors": list(self._get_extraordinary_factors(company))
         }
 
     async def fetch_company_financials(self, ticker: str) -> Dict[str, Any]:
@@ -290,8 +477,97 @@ class DataIngestionService:
 
     def add_company(self, company: Company):
         """Add a new company to the database"""
+        # Industries and headquarters repeat across companies; share one string object each
+        company.industry = sys.intern(company.industry)
+        if company.headquarters:
+            company.headquarters = sys.intern(company.headquarters)
+        
+        previous = self.companies_db.get(company.id)
+        if previous is not None:
+            self._name_lower_to_id.pop(previous.name.lower(), None)
+        
+        if previous is None:
+            self._company_seq[company.id] = self._next_company_seq
+            self._next_company_seq += 1
         self.companies_db[company.id] = company
+        self._name_lower_to_id[company.name.lower()] = company.id
+        self._extraordinary_factors.pop(company.id, None)
+        self._get_extraordinary_factors(company)
+        self._name_matcher = None
+        self._companies_cache = None
+        self._invalidate_profiles()
+
+    def update_company(self, company_id: str, **changes) -> Company:
+        """Change fields of a stored company and refresh the indexes and caches derived from it"""
+        company = self.companies_db[company_id]
+        # Unindex under the old name before it changes
+        self._name_lower_to_id.pop(company.name.lower(), None)
+        for field_name, value in changes.items():
+            setattr(company, field_name, value)
+        self.add_company(company)
+        return company
+
+    def _get_extraordinary_factors(self, company: Company) -> Tuple[str, ...]:
+        """Extraordinary factors for a company, recomputed if its score changed since they were cached"""
+        # Companies can be changed in place, so the cached entry is checked against the current score
+        entry = self._extraordinary_factors.get(company.id)
+        if entry is None or entry[0] != company.extraordinary_score:
+            factors = _EXTRAORDINARY_FACTORS if (company.extraordinary_score or 0) > 0.8 else ()
+            entry = (company.extraordinary_score, factors)
+            self._extraordinary_factors[company.id] = entry
+        return entry[1]
+
+    def remove_company(self, company_id: str) -> bool:
+        """Remove a company from the database"""
+        if company_id not in self.companies_db:
+            return False
+        company = self.companies_db.pop(company_id)
+        self._name_lower_to_id.pop(company.name.lower(), None)
+        self._company_seq.pop(company_id, None)
+        self._extraordinary_factors.pop(company_id, None)
+        self._name_matcher = None
+        self._companies_cache = None
+        self._invalidate_profiles()
+        return True
 
     def add_deal(self, deal: Deal):
         """Add a new deal to the database"""
+        deal.status = sys.intern(deal.status)
+        
+        if deal.id in self.deals_db:
+            self._unindex_deal(self.deals_db[deal.id])
+        
         self.deals_db[deal.id] = deal
+        self._deals_cache = None
+        self._invalidate_profiles()
+        self._deals_by_company[deal.source_company_id].append(deal.id)
+        if deal.target_company_id != deal.source_company_id:
+            self._deals_by_company[deal.target_company_id].append(deal.id)
+
+    def remove_deal(self, deal_id: str) -> bool:
+        """Remove a deal from the database"""
+        if deal_id not in self.deals_db:
+            return False
+        self._unindex_deal(self.deals_db.pop(deal_id))
+        self._deals_cache = None
+        self._invalidate_profiles()
+        return True
+
+    def get_deals_for_company(self, company_id: str) -> List[Deal]:
+        """Get all deals where the company is the source or target"""
+        return [self.deals_db[deal_id] for deal_id in self._deals_by_company.get(company_id, ())]
+
+    def _invalidate_profiles(self):
+        """Retire every cached profile after a store mutation"""
+        self._db_version += 1
+        self._profile_cache.clear()
+
+    def _unindex_deal(self, deal: Deal):
+        """Drop a deal from the per-company index"""
+        for company_id in {deal.source_company_id, deal.target_company_id}:
+            deal_ids = self._deals_by_company.get(company_id)
+            if deal_ids is None:
+                continue
+            deal_ids.remove(deal.id)
+            if not deal_ids:
+                del self._deals_by_company[company_id]
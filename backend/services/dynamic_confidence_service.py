@@ -3,16 +3,131 @@ Dynamic Confidence Scoring Service for HackMIT
 Replaces static confidence=1 with intelligent scoring based on data quality factors
 """
 
+import functools
 import json
 import logging
+from collections import OrderedDict
+from bisect import bisect_right
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
+from itertools import islice
+from urllib.parse import urlparse
 import re
+import string
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Deletes the characters structural quality treats as ordinary (letters, digits, whitespace, '-', '.')
+_STRUCTURAL_KEEP_TABLE = str.maketrans('', '', string.ascii_letters + string.digits + string.whitespace + '-.')
+_CAPS_RUN_RE = re.compile(r'[A-Z]{5,}')
+
+# Words a description is expected to contain for each deal type
+TYPE_KEYWORDS = {
+    'merger': ['merger', 'merge', 'combining'],
+    'acquisition': ['acquisition', 'acquire', 'bought', 'purchase'],
+    'partnership': ['partnership', 'partner', 'collaborate'],
+    'funding': ['funding', 'investment', 'raised', 'round']
+}
+_TYPE_PATTERNS = {
+    deal_type: re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+    for deal_type, keywords in TYPE_KEYWORDS.items()
+}
+
+# Factor weights in ConfidenceFactors field order
+_FACTOR_WEIGHT_VALUES = (0.25, 0.20, 0.20, 0.15, 0.15, 0.05)
+_FACTOR_WEIGHTS = np.array(_FACTOR_WEIGHT_VALUES)
+
+# Freshness bands: hours-old upper bounds and their scores (last score is for anything older)
+_FRESHNESS_HOURS = (1, 24, 168, 720)
+_FRESHNESS_SCORES = (1.0, 0.9, 0.7, 0.5, 0.3)
+
+_VERIFICATION_INDICATORS = ('verified', 'official', 'press-release', 'sec.gov', 'investor-relations')
+
+_SPAM_RE = re.compile(r'click here|limited time|act now|guaranteed', re.IGNORECASE)
+
+
+# Every event field read by the time- and batch-independent factors
+# (source reliability, completeness, semantic consistency, structural quality)
+_STATIC_FACTOR_FIELDS = (
+    'source', 'source_url', 'url', 'description', 'deal_type', 'deal_value',
+    'deal_date', 'source_company', 'target_company', 'companies_mentioned'
+)
+_MISSING = object()
+
+# Field -> accepted types for structural quality checks, as (exact-type set, isinstance tuple)
+_EXPECTED_FIELD_TYPES = tuple(
+    (field, frozenset(types), types)
+    for field, types in (
+        ('deal_value', (int, float, type(None))),
+        ('deal_date', (str, type(None))),
+        ('companies_mentioned', (list, type(None)))
+    )
+)
+
+
+class _StaticFactors(NamedTuple):
+    """Scores and issues that depend only on the event's own fields"""
+    source_reliability: float
+    data_completeness: float
+    semantic_consistency: float
+    structural_quality: float
+    semantic_issues: Tuple[str, ...]
+    structural_issues: Tuple[str, ...]
+
+
+class _TextScan(NamedTuple):
+    """Everything the quality checks need from one text field"""
+    bang_count: int
+    caps_runs: int  # capped at 3; the checks only need to know about a third run
+    special_chars: int
+    shouting: bool
+    has_spam: bool
+
+
+@functools.lru_cache(maxsize=4096)
+def _scan_text(value: str) -> _TextScan:
+    """
+    Collect the structural and spam metrics for a text field in one place
+    
+    Structural quality and suspicious-pattern detection both look at the
+    description (and company names), so the metrics are gathered once per
+    distinct string and shared.
+    """
+    remaining = value.translate(_STRUCTURAL_KEEP_TABLE)
+    if remaining.isascii():
+        special_chars = len(remaining)
+    else:
+        # Non-ASCII whitespace still counts as whitespace, as with regex \s
+        special_chars = sum(1 for char in remaining if not char.isspace())
+    
+    return _TextScan(
+        bang_count=value.count('!'),
+        caps_runs=sum(1 for _ in islice(_CAPS_RUN_RE.finditer(value), 3)),
+        special_chars=special_chars,
+        shouting=len(value) > 10 and value.isupper(),
+        has_spam=_SPAM_RE.search(value) is not None
+    )
+
+
+# Optional fields that add a small completeness bonus
+_BONUS_FIELDS = frozenset(['deal_value', 'description', 'companies_mentioned', 'source_url'])
+
+
+def _count_present_fields(event: Dict[str, Any], fields: FrozenSet[str]) -> int:
+    """Number of fields that are present and truthy in the event"""
+    # The set intersection runs in C; only keys actually present are checked
+    return sum(1 for field in event.keys() & fields if event[field])
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp; batches repeat the same strings, so results are memoized"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+@dataclass(slots=True)
 class ConfidenceFactors:
     """Individual factors contributing to confidence score"""
     source_reliability: float = 0.0
@@ -21,6 +136,17 @@ class ConfidenceFactors:
     temporal_freshness: float = 0.0
     semantic_consistency: float = 0.0
     structural_quality: float = 0.0
+    # Issues found while scoring, reported by get_confidence_explanation
+    semantic_issues: Tuple[str, ...] = ()
+    structural_issues: Tuple[str, ...] = ()
+    
+    def as_tuple(self) -> Tuple[float, ...]:
+        """Factor values in field order, matching _FACTOR_WEIGHT_VALUES"""
+        return (
+            self.source_reliability, self.data_completeness,
+            self.cross_validation, self.temporal_freshness,
+            self.semantic_consistency, self.structural_quality
+        )
 
 class DynamicConfidenceService:
     """
@@ -42,6 +168,18 @@ class DynamicConfidenceService:
             'exa_api': 0.70,
             'unknown': 0.50
         }
+        self._source_domains = tuple(self.source_weights)
+        
+        # Raw source string -> matched domain (None if no match); sources repeat heavily
+        self._domain_cache: Dict[str, Optional[str]] = {}
+        self._domain_cache_size = 4096
+        
+        # (source_company, target_company) -> lowercased company frozenset
+        self._company_set_cache: Dict[Tuple[Any, Any], FrozenSet[str]] = {}
+        
+        # Event content key -> static factors, so duplicate events skip re-scoring
+        self._static_factor_cache: "OrderedDict[Tuple, _StaticFactors]" = OrderedDict()
+        self._static_factor_cache_size = 16384
         
         # Required fields for different event types
         self.required_fields = {
@@ -50,56 +188,210 @@ class DynamicConfidenceService:
             'funding_round': ['target_company', 'deal_value', 'deal_date'],
             'default': ['source_company', 'target_company', 'deal_type']
         }
+        self.required_field_sets = {
+            deal_type: frozenset(fields) for deal_type, fields in self.required_fields.items()
+        }
     
     def calculate_confidence(self, event: Dict[str, Any], 
-                           related_events: Optional[List[Dict[str, Any]]] = None) -> float:
+                           related_events: Optional[List[Dict[str, Any]]] = None,
+                           min_threshold: float = 0.0) -> float:
         """
         Calculate dynamic confidence score for an M&A event
         
         Args:
             event: The M&A event to score
             related_events: Other events that might validate this one
+            min_threshold: Scores below this don't matter to the caller; if the
+                source and completeness factors already rule it out, the
+                remaining factors are skipped and an upper bound below the
+                threshold is returned instead of the exact score
             
         Returns:
             Confidence score between 0.0 and 1.0
         """
+        if min_threshold > 0.0:
+            upper_bound = self._confidence_upper_bound(event)
+            if upper_bound < min_threshold:
+                return upper_bound
+        
+        return self.calculate_confidence_with_factors(event, related_events)[0]
+    
+    def _confidence_upper_bound(self, event: Dict[str, Any]) -> float:
+        """Highest score the event could get given only its source and completeness factors"""
+        key = self._static_factor_key(event)
+        static = self._static_factor_cache.get(key) if key is not None else None
+        if static is not None:
+            source_reliability, data_completeness = static.source_reliability, static.data_completeness
+        else:
+            source_reliability = self._assess_source_reliability(event)
+            data_completeness = self._assess_data_completeness(event)
+        
+        # Remaining factors score at most 1.0 each; allow for the largest deal value bonus
+        bound = min(1.0, (
+            source_reliability * _FACTOR_WEIGHT_VALUES[0]
+            + data_completeness * _FACTOR_WEIGHT_VALUES[1]
+            + sum(_FACTOR_WEIGHT_VALUES[2:])
+            + 0.05
+        ))
+        
+        # Same penalty/bonus rules as _apply_confidence_adjustments
+        if source_reliability < 0.3 or data_completeness < 0.3:
+            bound *= 0.8
+        elif source_reliability > 0.8 and data_completeness > 0.8:
+            bound = min(1.0, bound + 0.1)
+        
+        return max(0.1, min(1.0, bound))
+    
+    def calculate_confidence_with_factors(self, event: Dict[str, Any],
+                                          related_events: Optional[List[Dict[str, Any]]] = None
+                                          ) -> Tuple[float, ConfidenceFactors]:
+        """
+        Calculate the confidence score along with the factors behind it
+        
+        Pass the factors on to get_confidence_explanation so the event is
+        only analyzed once.
+        
+        Returns:
+            (confidence score between 0.1 and 1.0, analyzed factors)
+        """
         factors = self._analyze_confidence_factors(event, related_events or [])
         
         # Weighted combination of factors
-        weights = {
-            'source_reliability': 0.25,
-            'data_completeness': 0.20,
-            'cross_validation': 0.20,
-            'temporal_freshness': 0.15,
-            'semantic_consistency': 0.15,
-            'structural_quality': 0.05
-        }
-        
         confidence = sum(
-            getattr(factors, factor) * weight 
-            for factor, weight in weights.items()
+            value * weight
+            for value, weight in zip(factors.as_tuple(), _FACTOR_WEIGHT_VALUES)
         )
         
         # Apply penalties and bonuses
         confidence = self._apply_confidence_adjustments(event, confidence, factors)
         
         # Clamp to valid range
-        return max(0.1, min(1.0, confidence))
+        return max(0.1, min(1.0, confidence)), factors
+    
+    def calculate_confidence_batch(self, events: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Calculate confidence scores for a batch of events at once
+        
+        Each event is cross-validated against the rest of the batch. Per-event
+        factors are gathered into columns, then weighting and adjustments run as
+        array operations over the whole batch.
+        
+        Args:
+            events: The M&A events to score
+            
+        Returns:
+            Array of confidence scores between 0.1 and 1.0, in event order
+        """
+        return self._score_batch(events)[0]
+    
+    def _score_batch(self, events: List[Dict[str, Any]]
+                     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[_StaticFactors]]:
+        """Scores, (N, 6) factor matrix, confirming-source counts and static factors for a batch"""
+        if not events:
+            return np.empty(0), np.empty((0, len(_FACTOR_WEIGHT_VALUES))), np.empty(0, dtype=int), []
+        
+        related_events = events if len(events) > 1 else []
+        now = datetime.now()
+        
+        hours_old = np.array([
+            self._hours_since_discovery(event, now) for event in events
+        ], dtype=float)
+        freshness_bands = np.searchsorted(_FRESHNESS_HOURS, hours_old, side='right')
+        temporal_freshness = np.where(
+            np.isnan(hours_old), 0.6, np.asarray(_FRESHNESS_SCORES)[freshness_bands]
+        )
+        
+        if related_events:
+            confirming = self._count_confirming_sources_batch(events)
+            cross_validation = self._cross_validation_from_counts(confirming)
+        else:
+            confirming = np.zeros(len(events), dtype=int)
+            cross_validation = np.full(len(events), 0.5)
+        
+        static_factors = [self._static_factors(event) for event in events]
+        static_scores = np.array([static[:4] for static in static_factors], dtype=float)
+        factors = np.column_stack([
+            static_scores[:, 0],
+            static_scores[:, 1],
+            cross_validation,
+            temporal_freshness,
+            static_scores[:, 2],
+            static_scores[:, 3]
+        ])
+        confidence = factors @ _FACTOR_WEIGHTS
+        
+        # Same adjustments as _apply_confidence_adjustments, over the whole batch
+        deal_values = np.array([self._deal_value_as_float(event) for event in events], dtype=float)
+        with np.errstate(invalid='ignore'):
+            value_bonus = np.select([deal_values > 1_000_000_000, deal_values > 100_000_000], [0.05, 0.02], 0.0)
+        confidence = np.minimum(1.0, confidence + value_bonus)
+        confidence = np.where((factors[:, :2] < 0.3).any(axis=1), confidence * 0.8, confidence)
+        confidence = np.where((factors > 0.8).all(axis=1), np.minimum(1.0, confidence + 0.1), confidence)
+        
+        return np.clip(confidence, 0.1, 1.0), factors, confirming, static_factors
     
     def _analyze_confidence_factors(self, event: Dict[str, Any], 
                                   related_events: List[Dict[str, Any]]) -> ConfidenceFactors:
         """Analyze individual confidence factors"""
-        factors = ConfidenceFactors()
+        static = self._static_factors(event)
+        
+        return ConfidenceFactors(
+            source_reliability=static.source_reliability,
+            data_completeness=static.data_completeness,
+            cross_validation=self._assess_cross_validation(event, related_events),
+            temporal_freshness=self._assess_temporal_freshness(event),
+            semantic_consistency=static.semantic_consistency,
+            structural_quality=static.structural_quality,
+            semantic_issues=static.semantic_issues,
+            structural_issues=static.structural_issues
+        )
+    
+    def _static_factors(self, event: Dict[str, Any]) -> _StaticFactors:
+        """
+        Source reliability, completeness, semantic and structural scores and issues
         
-        factors.source_reliability = self._assess_source_reliability(event)
-        factors.data_completeness = self._assess_data_completeness(event)
-        factors.cross_validation = self._assess_cross_validation(event, related_events)
-        factors.temporal_freshness = self._assess_temporal_freshness(event)
-        factors.semantic_consistency = self._assess_semantic_consistency(event)
-        factors.structural_quality = self._assess_structural_quality(event)
+        These depend only on the event's own fields, so they are cached by
+        event content; near-duplicate reports and refresh passes hit the cache.
+        Freshness and cross-validation depend on the clock and the batch and
+        are always computed.
+        """
+        key = self._static_factor_key(event)
+        if key is not None:
+            cached = self._static_factor_cache.get(key)
+            if cached is not None:
+                self._static_factor_cache.move_to_end(key)
+                return cached
+        
+        semantic_consistency, semantic_issues, structural_issues = self._assess_semantic_consistency(event)
+        factors = _StaticFactors(
+            source_reliability=self._assess_source_reliability(event),
+            data_completeness=self._assess_data_completeness(event),
+            semantic_consistency=semantic_consistency,
+            structural_quality=self._assess_structural_quality(event),
+            semantic_issues=semantic_issues,
+            structural_issues=structural_issues
+        )
         
+        if key is not None:
+            self._static_factor_cache[key] = factors
+            if len(self._static_factor_cache) > self._static_factor_cache_size:
+                self._static_factor_cache.popitem(last=False)
         return factors
     
+    def _static_factor_key(self, event: Dict[str, Any]) -> Optional[Tuple]:
+        """Hashable key over the static-factor fields, or None if a value can't be hashed"""
+        key = []
+        for field in _STATIC_FACTOR_FIELDS:
+            value = event.get(field, _MISSING)
+            # Keep the type so e.g. 1, 1.0 and True or a list and a tuple don't collide
+            key.append((type(value), tuple(value) if isinstance(value, list) else value))
+        key = tuple(key)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
     def _assess_source_reliability(self, event: Dict[str, Any]) -> float:
         """Assess reliability of the data source"""
         source = self._extract_source_domain(event)
@@ -118,15 +410,14 @@ class DynamicConfidenceService:
     def _assess_data_completeness(self, event: Dict[str, Any]) -> float:
         """Assess how complete the event data is"""
         deal_type = event.get('deal_type', 'default')
-        required_fields = self.required_fields.get(deal_type, self.required_fields['default'])
+        required_fields = self.required_field_sets.get(deal_type, self.required_field_sets['default'])
         
         # Count present required fields
-        present_fields = sum(1 for field in required_fields if event.get(field))
+        present_fields = _count_present_fields(event, required_fields)
         completeness_ratio = present_fields / len(required_fields)
         
         # Bonus for additional valuable fields
-        bonus_fields = ['deal_value', 'description', 'companies_mentioned', 'source_url']
-        bonus_count = sum(1 for field in bonus_fields if event.get(field))
+        bonus_count = _count_present_fields(event, _BONUS_FIELDS)
         bonus = min(0.2, bonus_count * 0.05)
         
         return min(1.0, completeness_ratio + bonus)
@@ -149,53 +440,64 @@ class DynamicConfidenceService:
         
         return 0.5
     
+    @staticmethod
+    def _cross_validation_from_counts(confirming: np.ndarray) -> np.ndarray:
+        """Map confirming-source counts to cross-validation scores"""
+        return np.select([confirming == 0, confirming == 1], [0.3, 0.7], default=0.95)
+    
     def _assess_temporal_freshness(self, event: Dict[str, Any]) -> float:
         """Assess how recent/fresh the information is"""
+        hours_old = self._hours_since_discovery(event, datetime.now())
+        if hours_old is None:
+            return 0.6  # Neutral score for unknown or unparseable discovery time
+        
+        # Very fresh (<1h), fresh (<1d), recent (<1w), older (<1mo), stale
+        return _FRESHNESS_SCORES[bisect_right(_FRESHNESS_HOURS, hours_old)]
+    
+    def _hours_since_discovery(self, event: Dict[str, Any], now: datetime) -> Optional[float]:
+        """Hours between discovered_at and now, or None if unknown or unparseable"""
         discovered_at = event.get('discovered_at')
         if not discovered_at:
-            return 0.6  # Neutral score for unknown discovery time
+            return None
         
         try:
             if isinstance(discovered_at, str):
-                discovery_time = datetime.fromisoformat(discovered_at.replace('Z', '+00:00'))
+                discovery_time = _parse_iso(discovered_at)
             else:
                 discovery_time = discovered_at
             
-            hours_old = (datetime.now() - discovery_time.replace(tzinfo=None)).total_seconds() / 3600
-            
-            if hours_old < 1:
-                return 1.0  # Very fresh
-            elif hours_old < 24:
-                return 0.9  # Fresh
-            elif hours_old < 168:  # 1 week
-                return 0.7  # Recent
-            elif hours_old < 720:  # 1 month
-                return 0.5  # Older
-            else:
-                return 0.3  # Stale
-                
+            return (now - discovery_time.replace(tzinfo=None)).total_seconds() / 3600
         except Exception:
-            return 0.6  # Default for parsing errors
+            return None
+    
+    def _deal_value_as_float(self, event: Dict[str, Any]) -> Optional[float]:
+        """Deal value as a float, or None if missing or not numeric"""
+        deal_value = event.get('deal_value')
+        if not deal_value:
+            return None
+        
+        try:
+            return float(deal_value)
+        except (ValueError, TypeError):
+            return None
     
-    def _assess_semantic_consistency(self, event: Dict[str, Any]) -> float:
-        """Assess internal consistency of the event data"""
+    def _assess_semantic_consistency(self, event: Dict[str, Any]
+                                     ) -> Tuple[float, Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Assess internal consistency of the event data
+        
+        Returns:
+            (score, consistency issues, deal value issues) - the deal value
+            issues are reported under structural quality in explanations
+        """
         consistency_score = 1.0
+        issues = []
+        value_issues = []
         
         # Check deal type consistency with description
-        deal_type = event.get('deal_type', '')
-        description = event.get('description', '').lower()
-        
-        if deal_type and description:
-            type_keywords = {
-                'merger': ['merger', 'merge', 'combining'],
-                'acquisition': ['acquisition', 'acquire', 'bought', 'purchase'],
-                'partnership': ['partnership', 'partner', 'collaborate'],
-                'funding': ['funding', 'investment', 'raised', 'round']
-            }
-            
-            expected_keywords = type_keywords.get(deal_type.lower(), [])
-            if expected_keywords and not any(keyword in description for keyword in expected_keywords):
-                consistency_score *= 0.8
+        if self._description_contradicts_type(event):
+            consistency_score *= 0.8
+            issues.append("deal type doesn't match description")
         
         # Check company name consistency
         source_company = event.get('source_company', '')
@@ -203,9 +505,9 @@ class DynamicConfidenceService:
         companies_mentioned = event.get('companies_mentioned', [])
         
         if source_company and target_company and companies_mentioned:
-            mentioned_names = [name.lower() for name in companies_mentioned]
-            if (source_company.lower() not in mentioned_names or 
-                target_company.lower() not in mentioned_names):
+            # _company_set holds the already-lowercased source/target names
+            mentioned_names = {name.lower() for name in companies_mentioned}
+            if not self._company_set(event) <= mentioned_names:
                 consistency_score *= 0.9
         
         # Check deal value reasonableness
@@ -213,40 +515,55 @@ class DynamicConfidenceService:
         if deal_value:
             try:
                 value = float(deal_value)
-                if value < 0 or value > 1_000_000_000_000:  # $1T limit
+                if value < 0:
+                    consistency_score *= 0.7
+                    value_issues.append("negative deal value")
+                elif value > 1_000_000_000_000:  # $1T limit
                     consistency_score *= 0.7
+                    value_issues.append("unrealistically high deal value")
             except (ValueError, TypeError):
                 consistency_score *= 0.8
+                value_issues.append("invalid deal value format")
         
-        return consistency_score
+        return consistency_score, tuple(issues), tuple(value_issues)
+    
+    def _description_contradicts_type(self, event: Dict[str, Any]) -> bool:
+        """Check whether the description lacks every keyword expected for the deal type"""
+        deal_type = event.get('deal_type', '')
+        description = event.get('description', '')
+        
+        if not (deal_type and description):
+            return False
+        
+        pattern = _TYPE_PATTERNS.get(deal_type.lower())
+        return pattern is not None and pattern.search(description) is None
     
     def _assess_structural_quality(self, event: Dict[str, Any]) -> float:
         """Assess the structural quality of the data"""
         quality_score = 1.0
         
         # Check for proper data types
-        expected_types = {
-            'deal_value': (int, float, type(None)),
-            'deal_date': (str, type(None)),
-            'companies_mentioned': (list, type(None))
-        }
-        
-        for field, expected_type in expected_types.items():
-            if field in event and not isinstance(event[field], expected_type):
-                quality_score *= 0.9
+        for field, exact_types, expected_types in _EXPECTED_FIELD_TYPES:
+            if field in event:
+                value = event[field]
+                # Exact type hit is the common case; isinstance keeps subclasses valid
+                if type(value) not in exact_types and not isinstance(value, expected_types):
+                    quality_score *= 0.9
         
         # Check for suspicious characters or formatting
         text_fields = ['source_company', 'target_company', 'description']
         for field in text_fields:
             value = event.get(field, '')
             if isinstance(value, str):
+                scan = _scan_text(value)
+                
                 # Penalty for excessive special characters
-                special_char_ratio = len(re.findall(r'[^a-zA-Z0-9\s\-\.]', value)) / max(1, len(value))
+                special_char_ratio = scan.special_chars / max(1, len(value))
                 if special_char_ratio > 0.3:
                     quality_score *= 0.8
                 
                 # Penalty for all caps (likely spam/low quality)
-                if len(value) > 10 and value.isupper():
+                if scan.shouting:
                     quality_score *= 0.7
         
         return quality_score
@@ -275,12 +592,7 @@ class DynamicConfidenceService:
             adjusted_confidence *= 0.8
         
         # Bonus for consistently high factors
-        all_factors = [
-            factors.source_reliability, factors.data_completeness,
-            factors.cross_validation, factors.temporal_freshness,
-            factors.semantic_consistency, factors.structural_quality
-        ]
-        if all(factor > 0.8 for factor in all_factors):
+        if all(factor > 0.8 for factor in factors.as_tuple()):
             adjusted_confidence = min(1.0, adjusted_confidence + 0.1)
         
         return adjusted_confidence
@@ -292,44 +604,54 @@ class DynamicConfidenceService:
         for field in source_fields:
             source = event.get(field, '')
             if source:
-                # Extract domain from URL
-                if 'http' in source:
-                    try:
-                        from urllib.parse import urlparse
-                        domain = urlparse(source).netloc.lower()
-                        return domain
-                    except:
-                        pass
-                
-                # Direct domain match
-                source_lower = source.lower()
-                for domain in self.source_weights:
-                    if domain in source_lower:
-                        return domain
+                domain = self._domain_cache.get(source, False)
+                if domain is False:
+                    domain = self._match_source_domain(source)
+                    if len(self._domain_cache) >= self._domain_cache_size:
+                        self._domain_cache.clear()
+                    self._domain_cache[source] = domain
+                if domain is not None:
+                    return domain
         
         return 'unknown'
     
+    def _match_source_domain(self, source: str) -> Optional[str]:
+        """Map one source string to a domain, or None if nothing matches"""
+        # Extract domain from URL
+        if 'http' in source:
+            try:
+                return urlparse(source).netloc.lower()
+            except ValueError:
+                pass
+        
+        # Direct domain match: the whole string or its last two labels (news.reuters.com),
+        # then any known domain appearing elsewhere in the text
+        source_lower = source.lower()
+        suffix = '.'.join(source_lower.rsplit('.', 2)[-2:])
+        if suffix in self.source_weights:
+            return suffix
+        return next((domain for domain in self._source_domains if domain in source_lower), None)
+    
     def _is_verified_source(self, event: Dict[str, Any]) -> bool:
         """Check if source has verification indicators"""
-        source_info = str(event.get('source', '')).lower()
-        url = str(event.get('source_url', '')).lower()
-        
-        verification_indicators = ['verified', 'official', 'press-release', 'sec.gov', 'investor-relations']
+        # Lowercase source and URL together; no indicator can span the separator
+        source_text = f"{event.get('source', '')}\n{event.get('source_url', '')}".lower()
         
-        return any(indicator in source_info or indicator in url for indicator in verification_indicators)
+        return any(indicator in source_text for indicator in _VERIFICATION_INDICATORS)
     
     def _has_suspicious_patterns(self, event: Dict[str, Any]) -> bool:
         """Detect suspicious patterns that might indicate low quality data"""
         # Check for spam-like patterns
         description = event.get('description', '')
         if isinstance(description, str):
+            scan = _scan_text(description)
+            
             # Too many exclamation marks or caps
-            if description.count('!') > 3 or len(re.findall(r'[A-Z]{5,}', description)) > 2:
+            if scan.bang_count > 3 or scan.caps_runs > 2:
                 return True
             
             # Suspicious keywords
-            spam_keywords = ['click here', 'limited time', 'act now', 'guaranteed']
-            if any(keyword in description.lower() for keyword in spam_keywords):
+            if scan.has_spam:
                 return True
         
         # Check for unrealistic deal values
@@ -350,25 +672,17 @@ class DynamicConfidenceService:
         """Count how many other sources confirm this event"""
         confirming_count = 0
         
-        event_companies = set()
-        if event.get('source_company'):
-            event_companies.add(event.get('source_company', '').lower())
-        if event.get('target_company'):
-            event_companies.add(event.get('target_company', '').lower())
-        event_companies.discard('')
+        event_companies = self._company_set(event)
+        event_source = self._extract_source_domain(event)
         
         for related_event in related_events:
-            related_companies = set()
-            if related_event.get('source_company'):
-                related_companies.add(related_event.get('source_company', '').lower())
-            if related_event.get('target_company'):
-                related_companies.add(related_event.get('target_company', '').lower())
-            related_companies.discard('')
+            # The event itself may be in the list; it never confirms itself
+            if related_event is event:
+                continue
             
             # Check if events involve same companies
-            if len(event_companies.intersection(related_companies)) >= 1:
+            if not event_companies.isdisjoint(self._company_set(related_event)):
                 # Check if from different source
-                event_source = self._extract_source_domain(event)
                 related_source = self._extract_source_domain(related_event)
                 
                 if event_source != related_source:
@@ -376,14 +690,75 @@ class DynamicConfidenceService:
         
         return confirming_count
     
+    def _company_set(self, event: Dict[str, Any]) -> FrozenSet[str]:
+        """Lowercased source/target company names of an event, shared across calls"""
+        key = (event.get('source_company'), event.get('target_company'))
+        companies = self._company_set_cache.get(key)
+        if companies is None:
+            companies = frozenset(name.lower() for name in key if name) - {''}
+            if len(self._company_set_cache) >= self._domain_cache_size:
+                self._company_set_cache.clear()
+            self._company_set_cache[key] = companies
+        return companies
+    
+    def _count_confirming_sources_batch(self, events: List[Dict[str, Any]],
+                                        block_size: int = 1024) -> np.ndarray:
+        """
+        Count confirming sources for every event in one pass over the batch
+        
+        Company names and source domains are interned to integer ids so the
+        pairwise "shares a company, different source" test becomes integer
+        array comparisons. Rows are processed in blocks to bound memory.
+        """
+        company_ids: Dict[str, int] = {}
+        source_ids: Dict[str, int] = {}
+        
+        def company_id(name: Any) -> int:
+            if not name:
+                return -1
+            name = name.lower()
+            if not name:
+                return -1
+            return company_ids.setdefault(name, len(company_ids))
+        
+        n = len(events)
+        source_company = np.array([company_id(e.get('source_company')) for e in events], dtype=np.int64)
+        target_company = np.array([company_id(e.get('target_company')) for e in events], dtype=np.int64)
+        source = np.array([
+            source_ids.setdefault(domain, len(source_ids))
+            for domain in (self._extract_source_domain(e) for e in events)
+        ], dtype=np.int64)
+        
+        confirming = np.zeros(n, dtype=np.int64)
+        for start in range(0, n, block_size):
+            rows = slice(start, min(start + block_size, n))
+            src = source_company[rows, None]
+            tgt = target_company[rows, None]
+            
+            shares_company = (
+                ((src == source_company) | (src == target_company)) & (src >= 0)
+            ) | (
+                ((tgt == source_company) | (tgt == target_company)) & (tgt >= 0)
+            )
+            # Source differs from itself never holds, so the diagonal drops out on its own
+            confirming[rows] = (shares_company & (source[rows, None] != source)).sum(axis=1)
+        
+        return confirming
+    
     def get_confidence_explanation(self, event: Dict[str, Any], 
                                  confidence_score: float,
-                                 related_events: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+                                 related_events: Optional[List[Dict[str, Any]]] = None,
+                                 factors: Optional[ConfidenceFactors] = None,
+                                 confirming_sources: Optional[int] = None) -> Dict[str, Any]:
         """
         Generate human-readable explanation of confidence score
         Useful for debugging and transparency in HackMIT demo
+        
+        Pass factors (and confirming_sources, if known) from an earlier
+        scoring call to skip re-analyzing the event.
         """
-        factors = self._analyze_confidence_factors(event, related_events or [])
+        if factors is None:
+            factors = self._analyze_confidence_factors(event, related_events or [])
         
         explanation = {
             'overall_confidence': confidence_score,
@@ -398,7 +773,9 @@ class DynamicConfidenceService:
                 },
                 'cross_validation': {
                     'score': factors.cross_validation,
-                    'explanation': self._explain_cross_validation(event, related_events or [])
+                    'explanation': self._explain_cross_validation(
+                        event, related_events or [], confirming_sources
+                    )
                 },
                 'temporal_freshness': {
                     'score': factors.temporal_freshness,
@@ -406,11 +783,11 @@ class DynamicConfidenceService:
                 },
                 'semantic_consistency': {
                     'score': factors.semantic_consistency,
-                    'explanation': self._explain_semantic_consistency(event)
+                    'explanation': self._explain_semantic_consistency(factors)
                 },
                 'structural_quality': {
                     'score': factors.structural_quality,
-                    'explanation': self._explain_structural_quality(event)
+                    'explanation': self._explain_structural_quality(factors)
                 }
             },
             'recommendations': self._generate_recommendations(factors, event)
@@ -435,14 +812,16 @@ class DynamicConfidenceService:
     def _explain_data_completeness(self, event: Dict[str, Any]) -> str:
         """Generate explanation for data completeness score"""
         deal_type = event.get('deal_type', 'default')
-        required_fields = self.required_fields.get(deal_type, self.required_fields['default'])
-        present_fields = sum(1 for field in required_fields if event.get(field))
+        required_fields = self.required_field_sets.get(deal_type, self.required_field_sets['default'])
+        present_fields = _count_present_fields(event, required_fields)
         
         return f"Has {present_fields}/{len(required_fields)} required fields for {deal_type} events"
     
-    def _explain_cross_validation(self, event: Dict[str, Any], related_events: List[Dict[str, Any]]) -> str:
+    def _explain_cross_validation(self, event: Dict[str, Any], related_events: List[Dict[str, Any]],
+                                  confirming_count: Optional[int] = None) -> str:
         """Generate explanation for cross validation score"""
-        confirming_count = self._count_confirming_sources(event, related_events)
+        if confirming_count is None:
+            confirming_count = self._count_confirming_sources(event, related_events)
         
         if confirming_count == 0:
             return "No confirming sources found - single source event"
@@ -453,68 +832,34 @@ class DynamicConfidenceService:
     
     def _explain_temporal_freshness(self, event: Dict[str, Any]) -> str:
         """Generate explanation for temporal freshness score"""
-        discovered_at = event.get('discovered_at')
-        if not discovered_at:
+        if not event.get('discovered_at'):
             return "Discovery time unknown"
         
-        try:
-            if isinstance(discovered_at, str):
-                discovery_time = datetime.fromisoformat(discovered_at.replace('Z', '+00:00'))
-            else:
-                discovery_time = discovered_at
-            
-            hours_old = (datetime.now() - discovery_time.replace(tzinfo=None)).total_seconds() / 3600
-            
-            if hours_old < 1:
-                return "Very fresh - discovered less than 1 hour ago"
-            elif hours_old < 24:
-                return f"Fresh - discovered {int(hours_old)} hours ago"
-            elif hours_old < 168:
-                return f"Recent - discovered {int(hours_old/24)} days ago"
-            else:
-                return f"Older - discovered {int(hours_old/168)} weeks ago"
-        except:
+        hours_old = self._hours_since_discovery(event, datetime.now())
+        if hours_old is None:
             return "Could not parse discovery time"
+        
+        if hours_old < 1:
+            return "Very fresh - discovered less than 1 hour ago"
+        elif hours_old < 24:
+            return f"Fresh - discovered {int(hours_old)} hours ago"
+        elif hours_old < 168:
+            return f"Recent - discovered {int(hours_old/24)} days ago"
+        else:
+            return f"Older - discovered {int(hours_old/168)} weeks ago"
     
-    def _explain_semantic_consistency(self, event: Dict[str, Any]) -> str:
+    def _explain_semantic_consistency(self, factors: ConfidenceFactors) -> str:
         """Generate explanation for semantic consistency score"""
-        issues = []
-        
-        deal_type = event.get('deal_type', '')
-        description = event.get('description', '').lower()
-        
-        if deal_type and description:
-            type_keywords = {
-                'merger': ['merger', 'merge', 'combining'],
-                'acquisition': ['acquisition', 'acquire', 'bought', 'purchase'],
-                'partnership': ['partnership', 'partner', 'collaborate'],
-                'funding': ['funding', 'investment', 'raised', 'round']
-            }
-            
-            expected_keywords = type_keywords.get(deal_type.lower(), [])
-            if expected_keywords and not any(keyword in description for keyword in expected_keywords):
-                issues.append("deal type doesn't match description")
+        issues = factors.semantic_issues
         
         if not issues:
             return "Event data is internally consistent"
         else:
             return f"Consistency issues: {', '.join(issues)}"
     
-    def _explain_structural_quality(self, event: Dict[str, Any]) -> str:
+    def _explain_structural_quality(self, factors: ConfidenceFactors) -> str:
         """Generate explanation for structural quality score"""
-        issues = []
-        
-        # Check deal value
-        deal_value = event.get('deal_value')
-        if deal_value:
-            try:
-                value = float(deal_value)
-                if value < 0:
-                    issues.append("negative deal value")
-                elif value > 1_000_000_000_000:
-                    issues.append("unrealistically high deal value")
-            except (ValueError, TypeError):
-                issues.append("invalid deal value format")
+        issues = factors.structural_issues
         
         if not issues:
             return "Data structure and formatting is good"
@@ -550,19 +895,34 @@ def update_events_with_dynamic_confidence(events: List[Dict[str, Any]]) -> List[
     """
     confidence_service = DynamicConfidenceService()
     
-    for i, event in enumerate(events):
-        # Get related events for cross-validation
-        related_events = [e for j, e in enumerate(events) if i != j]
-        
-        # Calculate dynamic confidence
-        confidence_score = confidence_service.calculate_confidence(event, related_events)
-        
+    # Every event is cross-validated against the whole list; _count_confirming_sources
+    # skips the event itself, so no per-event copy of the list is needed
+    related_events = events if len(events) > 1 else []
+    
+    # Calculate dynamic confidence for the whole batch, keeping the factors
+    # so the explanations don't analyze every event a second time
+    confidence_scores, factor_rows, confirming, static_factors = confidence_service._score_batch(events)
+    
+    # Integer basis points (0-10000) for compact storage and integer filtering/sorting
+    confidence_bps = np.rint(confidence_scores * 10000).astype(np.int16)
+    
+    for event, confidence_score, confidence_bp, factor_row, confirming_sources, static in zip(
+        events, confidence_scores.tolist(), confidence_bps.tolist(),
+        factor_rows.tolist(), confirming.tolist(), static_factors
+    ):
         # Update event with new confidence score
         event['confidence_score'] = confidence_score
+        event['confidence_score_bp'] = confidence_bp
         
         # Add confidence explanation for debugging
         event['confidence_explanation'] = confidence_service.get_confidence_explanation(
-            event, confidence_score, related_events
+            event, confidence_score, related_events,
+            factors=ConfidenceFactors(
+                *factor_row,
+                semantic_issues=static.semantic_issues,
+                structural_issues=static.structural_issues
+            ),
+            confirming_sources=confirming_sources
         )
     
     return events
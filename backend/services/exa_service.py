@@ -1,26 +1,156 @@
 import os
 import asyncio
-from typing import List, Dict, Optional
+import copy
+import functools
+import re
+import time
+from collections import OrderedDict
+from typing import Callable, List, Dict, Optional, Tuple
 import aiohttp
 import json
-from datetime import datetime, timedelta
+import orjson
+from datetime import date, datetime, timedelta, timezone
+from types import MappingProxyType
 import logging
 
+from services.service_utils import TokenBucket, truncate
+
 logger = logging.getLogger(__name__)
 
+# Words marking a result as funding-related (plain substrings, like the old keyword list)
+_FUNDING_RE = re.compile(r"funding|raised|investment|series|round|valuation|investor", re.IGNORECASE)
+
+# Caps on what _process_company_data collects per company
+MAX_KEY_HIGHLIGHTS = 10
+MAX_FUNDING_MENTIONS = 5
+
+# Attempts per search when Exa answers 429 Too Many Requests
+MAX_RATE_LIMIT_ATTEMPTS = 3
+
+
+@functools.lru_cache(maxsize=1)
+def _start_published_date(today: date) -> str:
+    """Start of the one-year search window, pinned to midnight UTC so payloads are stable all day"""
+    return f"{(today - timedelta(days=365)).isoformat()}T00:00:00.000Z"
+
+
+def _retry_after_seconds(headers, default: float) -> float:
+    """Seconds to wait from a Retry-After header, or the default if missing or not numeric"""
+    try:
+        return max(0.0, float(headers.get("Retry-After", default)))
+    except (TypeError, ValueError):
+        return default
+
+
 class ExaService:
-    def __init__(self):
-        self.api_key = os.getenv('EXA_API_KEY')
+    _shared: Optional["ExaService"] = None
+    # Event loop the shared instance's session belongs to, and the task closing it when that loop shuts down
+    _shared_loop: Optional[asyncio.AbstractEventLoop] = None
+    _shared_closer: Optional[asyncio.Task] = None
+    
+    # Search settings shared by every company query
+    _PAYLOAD_TEMPLATE = MappingProxyType({
+        "type": "neural",
+        "useAutoprompt": True,
+        "contents": {
+            "text": True,
+            "highlights": True,
+            "summary": True
+        },
+        "category": "company"
+    })
+    
+    def __init__(self, max_concurrent_requests: int = 10,
+                 session: Optional[aiohttp.ClientSession] = None,
+                 requests_per_second: float = 10, api_key: Optional[str] = None):
+        self.api_key = api_key or os.getenv('EXA_API_KEY')
         self.base_url = "https://api.exa.ai"
-        self.session = None
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # A caller-provided session is used as-is and left open for the caller to close
+        self.session = session
+        self._owns_session = session is None
+        # Caps in-flight Exa requests across every batch run on this instance
+        self._request_semaphore = asyncio.Semaphore(max_concurrent_requests)
+        # Paces request starts; 429 responses pause it for the server-given delay
+        self._rate_limiter = TokenBucket(requests_per_second)
+        
+        # (company, day, num_results, domains) -> (expires_at, processed result)
+        self._search_cache: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+        self._search_cache_size = 10_000
+        self._search_cache_ttl = 3600
+    
+    @classmethod
+    def shared(cls) -> "ExaService":
+        """Process-wide instance whose HTTP session is kept open and reused across calls
+        
+        The instance belongs to the running event loop. A call from a different loop (e.g.
+        a second asyncio.run) gets a fresh instance instead of a session bound to the old one.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._shared is None or cls._shared_loop is not loop:
+            cls._shared = cls()
+            cls._shared_loop = loop
+            cls._shared_closer = loop.create_task(cls._close_shared_on_shutdown(cls._shared))
+        return cls._shared
+    
+    @classmethod
+    async def _close_shared_on_shutdown(cls, instance: "ExaService"):
+        """Idle until cancelled, then close the instance if it is still the shared one
+        
+        asyncio.run() cancels and awaits leftover tasks before closing its loop, so scripts
+        that never call close_shared() still release the session instead of leaking it.
+        """
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            if cls._shared is instance:
+                cls._shared = None
+                cls._shared_loop = None
+                cls._shared_closer = None
+                await instance.close()
+    
+    @classmethod
+    async def close_shared(cls):
+        """Close the process-wide instance's HTTP session"""
+        if cls._shared is not None:
+            instance, closer = cls._shared, cls._shared_closer
+            cls._shared = None
+            cls._shared_loop = None
+            cls._shared_closer = None
+            if closer is not None and closer.get_loop() is asyncio.get_running_loop():
+                closer.cancel()
+            await instance.close()
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        await self._get_session()
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session, creating it on first use"""
+        if self.session is None or self.session.closed:
+            # All traffic goes to one host: cap per-host connections and cache its DNS lookup
+            connector = aiohttp.TCPConnector(
+                limit=64, limit_per_host=32, ttl_dns_cache=300, enable_cleanup_closed=True
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=30, connect=5)
+            )
+            self._owns_session = True
+        return self.session
+    
+    async def close(self):
+        """Close the HTTP session if this service created it"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
+        if self._owns_session:
+            self.session = None
     
     async def search_company(
         self, 
@@ -32,49 +162,95 @@ class ExaService:
         if not self.api_key:
             logger.error("EXA_API_KEY not found in environment variables")
             return {"error": "API key not configured"}
-            
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
         
+        # The search window is a year back from today, so results are cached per day
+        today = datetime.now(timezone.utc).date()
+        cache_key = (company_name.lower(), today, num_results, tuple(include_domains or ()))
+        cached = self._get_cached_search(cache_key)
+        if cached is not None:
+            cached["company_name"] = company_name
+            return cached
+            
         # Enhanced search query for better company results
         query = f"{company_name} company startup funding news recent"
         
         payload = {
+            **self._PAYLOAD_TEMPLATE,
             "query": query,
-            "type": "neural",
-            "useAutoprompt": True,
             "numResults": num_results,
-            "contents": {
-                "text": True,
-                "highlights": True,
-                "summary": True
-            },
-            "category": "company",
-            "startPublishedDate": (datetime.now() - timedelta(days=365)).isoformat(),
+            "startPublishedDate": _start_published_date(today),
         }
         
         if include_domains:
             payload["includeDomains"] = include_domains
             
         try:
-            async with self.session.post(
+            data = await self.search(payload)
+            result = await self._process_company_data(company_name, data)
+            self._cache_search(cache_key, result)
+            return result
+        except Exception as e:
+            logger.error("Error calling Exa API: %s", e)
+            return {"error": str(e)}
+    
+    async def search(self, payload: Dict) -> Dict:
+        """POST a payload to Exa's search endpoint and return the decoded reply
+        
+        Requests are paced by the rate limiter and retried on 429; any other
+        non-200 status raises ValueError.
+        """
+        # Serialized once, reused across rate-limit retries
+        request_body = orjson.dumps(payload)
+        
+        session = await self._get_session()
+        for attempt in range(MAX_RATE_LIMIT_ATTEMPTS):
+            await self._rate_limiter.acquire()
+            async with session.post(
                 f"{self.base_url}/search",
-                headers=headers,
-                json=payload
+                headers=self._headers,
+                data=request_body
             ) as response:
+                if response.status == 429 and attempt < MAX_RATE_LIMIT_ATTEMPTS - 1:
+                    delay = _retry_after_seconds(response.headers, default=2 ** attempt)
+                    logger.warning("Exa API rate limited, retrying %r in %ss", payload.get("query"), delay)
+                    self._rate_limiter.pause(delay)
+                    continue
+                
+                if response.headers.get("X-RateLimit-Remaining") == "0":
+                    # Quota for this window is spent; hold off before the next request
+                    self._rate_limiter.pause(1.0)
+                
                 if response.status == 200:
-                    data = await response.json()
-                    return await self._process_company_data(company_name, data)
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Exa API error: {response.status} - {error_text}")
-                    return {"error": f"API request failed: {response.status}"}
-                    
-        except Exception as e:
-            logger.error(f"Error calling Exa API: {str(e)}")
-            return {"error": str(e)}
+                    return orjson.loads(await response.read())
+                
+                # Error pages can be large HTML; only the start is useful in the log,
+                # and the body isn't read at all when error logging is off
+                if logger.isEnabledFor(logging.ERROR):
+                    error_text = (await response.content.read(2048)).decode('utf-8', errors='replace')
+                    logger.error("Exa API error: %s - %s", response.status, error_text[:500])
+                raise ValueError(f"API request failed: {response.status}")
+    
+    def _get_cached_search(self, cache_key: Tuple) -> Optional[Dict]:
+        """Copy of a cached search result, or None if missing or expired"""
+        entry = self._search_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        expires_at, result = entry
+        if expires_at <= time.monotonic():
+            del self._search_cache[cache_key]
+            return None
+        
+        self._search_cache.move_to_end(cache_key)
+        # Callers annotate the result dicts, so never hand out the cached one
+        return copy.deepcopy(result)
+    
+    def _cache_search(self, cache_key: Tuple, result: Dict):
+        """Remember a successful search result for the cache TTL"""
+        self._search_cache[cache_key] = (time.monotonic() + self._search_cache_ttl, copy.deepcopy(result))
+        self._search_cache.move_to_end(cache_key)
+        if len(self._search_cache) > self._search_cache_size:
+            self._search_cache.popitem(last=False)
     
     async def _process_company_data(self, company_name: str, exa_data: Dict) -> Dict:
         """Process and structure the Exa API response"""
@@ -92,35 +268,38 @@ class ExaService:
                 }
             }
         
-        # Extract key information
+        # Extract key information; highlights and funding mentions keep the first
+        # MAX_KEY_HIGHLIGHTS / MAX_FUNDING_MENTIONS found and stop collecting there
         news_articles = []
         key_highlights = []
         funding_mentions = []
         
-        for result in results[:10]:  # Limit to top 10 results
+        # Limit to top 10 results (no copy when there are already 10 or fewer)
+        top_results = results if len(results) <= 10 else results[:10]
+        for result in top_results:
+            get = result.get
             article = {
-                "title": result.get("title", ""),
-                "url": result.get("url", ""),
-                "published_date": result.get("publishedDate", ""),
-                "summary": result.get("summary", ""),
-                "highlights": result.get("highlights", [])
+                "title": get("title", ""),
+                "url": get("url", ""),
+                "published_date": get("publishedDate", ""),
+                "summary": get("summary", ""),
+                "highlights": get("highlights", [])
             }
             news_articles.append(article)
             
-            # Extract highlights for key insights
-            if result.get("highlights"):
-                key_highlights.extend(result["highlights"][:3])  # Top 3 highlights per article
-            
-            # Look for funding-related content
-            text = result.get("text", "").lower()
-            summary = result.get("summary", "").lower()
+            # Extract highlights for key insights (top 3 per article)
+            highlight_room = MAX_KEY_HIGHLIGHTS - len(key_highlights)
+            if highlight_room > 0 and article["highlights"]:
+                key_highlights.extend(article["highlights"][:min(3, highlight_room)])
             
-            funding_keywords = ["funding", "raised", "investment", "series", "round", "valuation", "investor"]
-            if any(keyword in text or keyword in summary for keyword in funding_keywords):
+            # Look for funding-related content; once the list is full the scan is skipped
+            if len(funding_mentions) < MAX_FUNDING_MENTIONS and (
+                _FUNDING_RE.search(get("text", "")) or _FUNDING_RE.search(article["summary"])
+            ):
                 funding_mentions.append({
-                    "source": result.get("title", ""),
-                    "url": result.get("url", ""),
-                    "excerpt": result.get("summary", "")[:200] + "..."
+                    "source": article["title"],
+                    "url": article["url"],
+                    "excerpt": f"{article['summary'][:200]}..."
                 })
         
         # Generate overall summary
@@ -131,9 +310,9 @@ class ExaService:
             "exa_data": {
                 "summary": overall_summary,
                 "news_articles": news_articles,
-                "key_highlights": key_highlights[:10],  # Top 10 highlights
+                "key_highlights": key_highlights,
                 "funding_info": {
-                    "mentions": funding_mentions[:5],  # Top 5 funding mentions
+                    "mentions": funding_mentions,
                     "has_recent_funding": len(funding_mentions) > 0
                 },
                 "recent_activity": [
@@ -156,7 +335,7 @@ class ExaService:
         # Use the first result's summary as base, or create from highlights
         primary_summary = results[0].get("summary", "")
         if primary_summary and len(primary_summary) > 50:
-            return primary_summary[:300] + "..." if len(primary_summary) > 300 else primary_summary
+            return truncate(primary_summary, 300)
         
         # Fallback: combine highlights
         all_highlights = []
@@ -166,41 +345,62 @@ class ExaService:
         
         if all_highlights:
             combined = " ".join(all_highlights[:3])  # Top 3 highlights
-            return combined[:300] + "..." if len(combined) > 300 else combined
+            return truncate(combined, 300)
         
         return f"Recent activity and news coverage found for {company_name}"
 
-    async def enrich_company_batch(self, companies: List[str]) -> Dict[str, Dict]:
-        """Enrich multiple companies with Exa data"""
-        results = {}
-        
-        # Process in batches to avoid rate limiting
-        batch_size = 5
-        for i in range(0, len(companies), batch_size):
-            batch = companies[i:i + batch_size]
-            batch_tasks = [self.search_company(company) for company in batch]
-            
-            batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-            
-            for company, result in zip(batch, batch_results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error processing {company}: {result}")
-                    results[company] = {"error": str(result)}
+    async def enrich_company_batch(
+        self,
+        companies: List[str],
+        on_result: Optional[Callable[[str, Dict], None]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Enrich multiple companies with Exa data
+        
+        on_result, if given, is called with each company's result as soon as it
+        arrives (e.g. to report progress or persist incrementally). The returned
+        dict keeps the input order.
+        
+        Names that differ only in case or surrounding whitespace are searched
+        once and the result is shared by every spelling.
+        """
+        # Pre-seeded so the result order matches the input, not completion order
+        results = dict.fromkeys(companies)
+        
+        names_by_key: Dict[str, List[str]] = {}
+        for company in results:
+            names_by_key.setdefault(company.strip().lower(), []).append(company)
+        
+        # Keep a fixed number of requests in flight instead of stalling on
+        # the slowest request of each fixed-size batch
+        async def search_one(key: str, company: str) -> Tuple[str, Dict]:
+            try:
+                async with self._request_semaphore:
+                    return key, await self.search_company(company)
+            except Exception as e:
+                logger.error("Error processing %s: %s", company, e)
+                return key, {"error": str(e)}
+        
+        searches = [search_one(key, names[0]) for key, names in names_by_key.items()]
+        for next_result in asyncio.as_completed(searches):
+            key, result = await next_result
+            names = names_by_key[key]
+            for name in names:
+                if name != names[0] and "company_name" in result:
+                    name_result = {**result, "company_name": name}
                 else:
-                    results[company] = result
-            
-            # Rate limiting delay
-            await asyncio.sleep(1)
+                    name_result = result
+                results[name] = name_result
+                if on_result is not None:
+                    on_result(name, name_result)
         
         return results
 
 # Utility functions for integration
 async def get_enhanced_company_data(company_name: str) -> Dict:
     """Get enhanced company data using Exa API"""
-    async with ExaService() as exa:
-        return await exa.search_company(company_name)
+    return await ExaService.shared().search_company(company_name)
 
 async def enrich_yc_companies(yc_companies: List[str]) -> Dict:
     """Enrich YC company list with Exa data"""
-    async with ExaService() as exa:
-        return await exa.enrich_company_batch(yc_companies)
+    return await ExaService.shared().enrich_company_batch(yc_companies)
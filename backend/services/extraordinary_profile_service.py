@@ -4,19 +4,36 @@ Deep research service for generating comprehensive company profiles
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import aclosing
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, NamedTuple, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 import uuid
 import re
 import os
 from urllib.parse import urlparse
-import requests
-from dataclasses import asdict
+import numpy as np
+import orjson
+from dataclasses import asdict, dataclass, field
 from dotenv import load_dotenv
+from pydantic import ValidationError
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from services.exa_service import ExaService
+from services.service_utils import TokenBucket, truncate
 from models.extraordinary_profile import (
     ExtraordinaryProfile, NotableArticle, Recognition, ExtraordinaryFeat,
     CompanyStats, ResearchSource, ProfileGenerationRequest, ProfileSearchQuery,
@@ -25,6 +42,390 @@ from models.extraordinary_profile import (
 
 logger = logging.getLogger(__name__)
 
+# Keywords counted by presence in article text for relevance and sentiment scoring
+_QUALITY_TERMS = frozenset({'breakthrough', 'innovation', 'achievement', 'milestone', 'success', 'growth', 'expansion'})
+_POSITIVE_TERMS = frozenset({'success', 'growth', 'breakthrough', 'achievement', 'innovation', 'expansion', 'milestone'})
+_NEGATIVE_TERMS = frozenset({'challenge', 'problem', 'decline', 'loss', 'controversy', 'criticism', 'failure'})
+_ARTICLE_KEYWORDS = _QUALITY_TERMS | _POSITIVE_TERMS | _NEGATIVE_TERMS
+
+if AHOCORASICK_AVAILABLE:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _term in _ARTICLE_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_term, _term)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+
+def _find_keywords(text_lower: str) -> frozenset:
+    """Return every scoring keyword that occurs anywhere in already-lowercased text"""
+    if AHOCORASICK_AVAILABLE:
+        # One linear scan finds all keywords, overlapping ones included
+        return frozenset(term for _, term in _KEYWORD_AUTOMATON.iter(text_lower))
+    return frozenset(term for term in _ARTICLE_KEYWORDS if term in text_lower)
+
+
+def _canonical_url(url: str) -> str:
+    """URL without query string, fragment or trailing slash, for duplicate checks"""
+    return url.split('#', 1)[0].split('?', 1)[0].rstrip('/')
+
+
+async def _outcomes_in_order(keyed_awaitables):
+    """Start every awaitable at once and yield (key, result or exception) in the given order
+    
+    Each outcome is yielded as soon as it and everything before it are done, so
+    callers can process early results while later ones are still in flight.
+    Whatever is still pending when the consumer stops early is cancelled.
+    """
+    keys = []
+    tasks = []
+    for key, awaitable in keyed_awaitables:
+        keys.append(key)
+        tasks.append(asyncio.ensure_future(awaitable))
+    
+    try:
+        for index, key in enumerate(keys):
+            try:
+                outcome = await tasks[index]
+            except Exception as e:
+                outcome = e
+            # Drop our reference so a processed response can be freed
+            tasks[index] = None
+            yield key, outcome
+    finally:
+        for task in tasks:
+            if task is None:
+                continue
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # Mark skipped failures as retrieved
+
+
+def _estimated_claude_tokens(request: Dict[str, Any]) -> int:
+    """Rough token cost of a Claude request: prompt at ~4 characters per token plus the output cap"""
+    prompt_chars = sum(len(message.get('content', '')) for message in request.get('messages', ()))
+    return prompt_chars // 4 + request.get('max_tokens', 0)
+
+
+def _read_profile_file(profile_file: Path) -> ExtraordinaryProfile:
+    """Read and validate one saved profile (blocking; run in a worker thread)"""
+    raw = profile_file.read_bytes()
+    try:
+        return ExtraordinaryProfile(**orjson.loads(raw))
+    except ValidationError:
+        # orjson reads integers beyond 64 bits as floats; the stdlib decoder keeps them exact
+        return ExtraordinaryProfile(**json.loads(raw))
+
+
+def _dump_profile(data: Dict[str, Any]) -> bytes:
+    """Serialize a profile dict in the same format json.dump(..., indent=2, default=str) wrote"""
+    try:
+        # Datetimes go through default=str too, keeping the "YYYY-MM-DD HH:MM:SS" form of older files
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME, default=str)
+    except orjson.JSONEncodeError:
+        # orjson rejects integers beyond 64 bits (e.g. extracted stats); the stdlib encoder doesn't
+        return json.dumps(data, indent=2, default=str).encode()
+
+
+def _write_profile_file(profile_file: Path, data: bytes):
+    """Atomically replace a saved profile (blocking; run in a worker thread)"""
+    # Write beside the target and rename, so readers never see a half-written profile
+    tmp_file = profile_file.with_name(f".{profile_file.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        tmp_file.write_bytes(data)
+        os.replace(tmp_file, profile_file)
+    finally:
+        tmp_file.unlink(missing_ok=True)
+
+
+class _ProfileIndexEntry(NamedTuple):
+    """The few fields profile search needs, kept per file until it changes on disk"""
+    mtime_ns: int
+    size: int
+    company_name_lower: str
+    industry_lower: str
+    overall_profile_score: float
+
+
+class _ProfileSearchColumns(NamedTuple):
+    """Column-wise copy of the profile index, in directory order, for vectorized filtering"""
+    files: List[Path]
+    company_names_lower: np.ndarray
+    industries_lower: np.ndarray
+    overall_profile_scores: np.ndarray
+
+# Research query templates ({c} = company name, {i} = industry), grouped as they
+# are combined for each research depth
+_BASE_QUERY_TEMPLATES = (
+    "{c} company profile",
+    "{c} achievements milestones",
+    "{c} awards recognition",
+    "{c} news articles",
+    "{c} funding valuation",
+)
+_INDUSTRY_QUERY_TEMPLATES = (
+    "{c} {i} innovation",
+    "{c} {i} leadership",
+    "{c} {i} market share",
+)
+_DEEP_QUERY_TEMPLATES = (
+    "{c} CEO founder interview",
+    "{c} technical breakthrough",
+    "{c} patent technology",
+    "{c} customer success stories",
+    "{c} employee growth culture",
+    "{c} social impact sustainability",
+    "{c} competitive advantage",
+    "{c} future roadmap vision",
+)
+_COMPREHENSIVE_QUERY_TEMPLATES = (
+    "{c} financial performance metrics",
+    "{c} user adoption statistics",
+    "{c} partnership collaborations",
+    "{c} product launches features",
+    "{c} market expansion international",
+    "{c} research development R&D",
+    "{c} thought leadership content",
+    "{c} industry analysis reports",
+    "{c} customer testimonials reviews",
+    "{c} team expertise talent",
+)
+_QUERY_TEMPLATES = {
+    "basic": _BASE_QUERY_TEMPLATES[:3],
+    "standard": _BASE_QUERY_TEMPLATES + _INDUSTRY_QUERY_TEMPLATES[:2],
+    "deep": _BASE_QUERY_TEMPLATES + _INDUSTRY_QUERY_TEMPLATES + _DEEP_QUERY_TEMPLATES[:5],
+    "comprehensive": (_BASE_QUERY_TEMPLATES + _INDUSTRY_QUERY_TEMPLATES +
+                      _DEEP_QUERY_TEMPLATES + _COMPREHENSIVE_QUERY_TEMPLATES),
+}
+
+
+@lru_cache(maxsize=256)
+def _research_queries(company_name: str, industry: str, depth: str) -> Tuple[str, ...]:
+    """Research queries for a company at a depth level; unknown depths get the full set"""
+    templates = _QUERY_TEMPLATES.get(depth, _QUERY_TEMPLATES["comprehensive"])
+    return tuple(template.format(c=company_name, i=industry) for template in templates)
+
+# General quotes of reasonable length
+_GENERIC_QUOTE_RE = re.compile(r'"([^"]{50,200})"', re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _company_quote_pattern(company_name: str) -> re.Pattern:
+    """Compiled pattern for quoted text mentioning the company, built once per company"""
+    return re.compile(r'"([^"]*' + re.escape(company_name) + r'[^"]*)"', re.IGNORECASE)
+
+# Recognition patterns ({c} = escaped company name); each captures a year or a rank
+_RECOGNITION_PATTERN_TEMPLATES = (
+    r'(\d{{4}}).*?award.*?{c}',
+    r'{c}.*?ranked.*?(\d+)',
+    r'{c}.*?winner.*?(\d{{4}})',
+    r'top.*?(\d+).*?{c}',
+)
+
+# Title terms marking a recognition as a ranking
+_RANKING_TERMS = ('top', 'best', 'ranking')
+# Outlets that raise a recognition's significance, by lowercase term -> display name;
+# checked in order, so the first term found in a domain names the organization
+_PRESTIGE_OUTLETS = {
+    'forbes': 'Forbes',
+    'fortune': 'Fortune',
+    'techcrunch': 'TechCrunch',
+}
+
+
+@lru_cache(maxsize=128)
+def _recognition_patterns(company_name: str) -> Tuple[re.Pattern, ...]:
+    """Compiled recognition patterns for a company, built once per company"""
+    escaped = re.escape(company_name)
+    return tuple(
+        re.compile(template.format(c=escaped), re.IGNORECASE)
+        for template in _RECOGNITION_PATTERN_TEMPLATES
+    )
+
+
+def _content_fingerprint(text: Optional[str], prefix_chars: int = 512) -> str:
+    """Case- and whitespace-normalized opening of a document, used to spot syndicated copies"""
+    if not text:
+        return ""
+    return " ".join(text[:prefix_chars].lower().split())
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_json_reply(reply: str) -> Any:
+    """Parse a model reply as JSON, tolerating prose or code fences around a JSON object"""
+    try:
+        return orjson.loads(reply)
+    except orjson.JSONDecodeError:
+        # Fall back to the first complete object, ignoring anything before or after it
+        # (the stdlib decoder also accepts the NaN/Infinity literals orjson rejects)
+        start = reply.find('{')
+        if start < 0:
+            raise
+        result, _ = _JSON_DECODER.raw_decode(reply, start)
+        return result
+
+
+def _prompt_snippet(text: Optional[str], max_chars: int) -> str:
+    """Text with whitespace runs collapsed, cut to at most max_chars, for embedding in prompts"""
+    if not text:
+        return ""
+    return " ".join(text.split())[:max_chars].rstrip()
+
+
+@dataclass
+class ExaSearchResult:
+    """One Exa search hit with its requested contents"""
+    url: str
+    title: Optional[str] = None
+    text: Optional[str] = None
+    highlights: List[str] = field(default_factory=list)
+    published_date: Optional[str] = None
+
+
+@dataclass
+class ExaSearchResponse:
+    results: List[ExaSearchResult]
+
+
+@dataclass
+class _InflightSearch:
+    """An Exa search in progress and how many callers are still waiting on it"""
+    task: asyncio.Task
+    waiters: int = 0
+
+
+class ExaSearchClient:
+    """
+    exa_py-style search_and_contents on top of ExaService
+    
+    Mirrors exa_py's keyword arguments, while the HTTP session, connection
+    pooling, rate limiting and 429 retries are ExaService's.
+    """
+    
+    # exa_py-style keyword arguments -> Exa API field names
+    _OPTION_NAMES = {
+        "use_autoprompt": "useAutoprompt",
+        "num_results": "numResults",
+        "start_published_date": "startPublishedDate",
+        "include_domains": "includeDomains",
+    }
+    
+    def __init__(self, api_key: str, base_url: str = "https://api.exa.ai"):
+        self._exa = ExaService(api_key=api_key)
+        self._exa.base_url = base_url
+    
+    @property
+    def base_url(self) -> str:
+        return self._exa.base_url
+    
+    @base_url.setter
+    def base_url(self, value: str):
+        self._exa.base_url = value
+    
+    async def close(self):
+        """Close the underlying HTTP session"""
+        await self._exa.close()
+    
+    async def search_and_contents(self, query: str, text: bool = False,
+                                  highlights: bool = False, **options) -> ExaSearchResponse:
+        """Search Exa and return results with the requested contents"""
+        payload: Dict[str, Any] = {"query": query}
+        for name, value in options.items():
+            payload[self._OPTION_NAMES.get(name, name)] = value
+        
+        contents = {}
+        if text:
+            contents["text"] = True
+        if highlights:
+            contents["highlights"] = True
+        if contents:
+            payload["contents"] = contents
+        
+        data = await self._exa.search(payload)
+        
+        return ExaSearchResponse(results=[
+            ExaSearchResult(
+                url=item.get("url", ""),
+                title=item.get("title"),
+                text=item.get("text"),
+                highlights=item.get("highlights") or [],
+                published_date=item.get("publishedDate")
+            )
+            for item in data.get("results", [])
+        ])
+
+
+class ExaResultCache:
+    """
+    SQLite-backed cache of Exa search responses, kept across profile runs
+    
+    Entries expire after the weekly profile refresh window; beyond max_entries
+    the least recently read responses are dropped first. Methods block on disk I/O
+    and are safe to call from worker threads.
+    """
+    
+    def __init__(self, path: Path, ttl_seconds: int = 7 * 24 * 3600, max_entries: int = 20000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One connection shared by the worker threads, used by one thread at a time
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS exa_results ("
+                "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, payload BLOB NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS exa_results_accessed ON exa_results (accessed_at)"
+            )
+    
+    @staticmethod
+    def make_key(query: str, options: Dict[str, Any]) -> str:
+        """Stable key for a query and its search options"""
+        raw = orjson.dumps([query, options], option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[ExaSearchResponse]:
+        """Return the cached response for key, or None if missing or expired"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, payload FROM exa_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            now = time.time()
+            with self._conn:
+                if now - row[0] > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM exa_results WHERE key = ?", (key,))
+                    return None
+                self._conn.execute("UPDATE exa_results SET accessed_at = ? WHERE key = ?", (now, key))
+        
+        return ExaSearchResponse(results=[ExaSearchResult(**item) for item in orjson.loads(row[1])])
+    
+    def set(self, key: str, response: ExaSearchResponse):
+        """Store a response, evicting the least recently read entries over the limit"""
+        payload = orjson.dumps(response.results)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO exa_results (key, stored_at, accessed_at, payload) VALUES (?, ?, ?, ?)",
+                (key, now, now, payload)
+            )
+            self._conn.execute(
+                "DELETE FROM exa_results WHERE key IN ("
+                "SELECT key FROM exa_results ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
 class ExtraordinaryProfileService:
     def __init__(self, exa_api_key: str = None):
         # Load environment variables from .env file
@@ -36,18 +437,14 @@ class ExtraordinaryProfileService:
         self.exa_api_key = exa_api_key or os.getenv("EXA_API_KEY")
         self.profiles_dir = Path(__file__).parent.parent / "data" / "extraordinary_profiles"
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        # Exa response cache lives outside the tracked data directory
+        self.exa_cache_path = Path(__file__).parent.parent / ".cache" / "exa_results.sqlite3"
         
-        # Initialize Exa client
+        # Initialize Exa client (one shared HTTP session for every research query)
         self.exa_client = None
         if self.exa_api_key:
-            try:
-                from exa_py import Exa
-                self.exa_client = Exa(api_key=self.exa_api_key)
-                logger.info("Exa API client initialized for deep research")
-            except ImportError:
-                logger.warning("Exa API not available. Install with: pip install exa_py")
-            except Exception as e:
-                logger.error(f"Failed to initialize Exa client: {e}")
+            self.exa_client = ExaSearchClient(api_key=self.exa_api_key)
+            logger.info("Exa API client initialized for deep research")
         else:
             logger.warning("No Exa API key found in .env file - research will be limited")
         
@@ -57,7 +454,7 @@ class ExtraordinaryProfileService:
         if claude_api_key:
             try:
                 import anthropic
-                self.claude_client = anthropic.Anthropic(api_key=claude_api_key)
+                self.claude_client = anthropic.AsyncAnthropic(api_key=claude_api_key)
                 logger.info("Claude AI client initialized for content analysis")
             except ImportError:
                 logger.warning("Anthropic client not available. Install with: pip install anthropic")
@@ -67,6 +464,42 @@ class ExtraordinaryProfileService:
         self.max_total_articles = 25
         self.quality_threshold = 0.4
         self.research_timeout = 300  # 5 minutes max per company
+        self.max_concurrent_queries = 8
+        self.claude_batch_size = 8  # Articles analyzed per Claude request
+        self.max_concurrent_claude_requests = 4
+        self.claude_requests_per_minute = 50
+        self.claude_tokens_per_minute = 50_000  # Estimated input plus requested output tokens
+        self.max_feat_passages = 5  # Passages sent to Claude for feats extraction
+        self.max_stats_passages = 3  # Passages sent to Claude for stats extraction
+        
+        # Shared across all research tasks so concurrent queries stay under Exa's rate limit
+        self._exa_semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+        self._claude_semaphore = asyncio.Semaphore(self.max_concurrent_claude_requests)
+        # Pace Claude requests under the account's per-minute limits instead of waiting out 429s
+        self._claude_request_limiter = TokenBucket(self.claude_requests_per_minute, period=60)
+        self._claude_token_limiter = TokenBucket(self.claude_tokens_per_minute, period=60)
+        
+        # Persistent Exa response cache, opened on first search
+        self._exa_cache: Optional[ExaResultCache] = None
+        
+        # Searches currently in flight, so identical concurrent queries share one request
+        self._exa_inflight: Dict[str, _InflightSearch] = {}
+        
+        # Search index over saved profiles, keyed by file name, plus its column form
+        self._profile_index: Dict[str, _ProfileIndexEntry] = {}
+        self._profile_columns: Optional[_ProfileSearchColumns] = None
+        # Refreshes run in worker threads; one at a time may update the index
+        self._profile_index_lock = threading.Lock()
+        
+        # Recently loaded/saved profiles: company_id -> (expires_at, profile)
+        self._profile_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._profile_cache_size = 256
+        self._profile_cache_ttl = 300
+        
+        # Claude replies that parsed as JSON: request hash -> (expires_at, reply text)
+        self._claude_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._claude_cache_size = 10_000
+        self._claude_cache_ttl = 7 * 24 * 3600
         
         # Enhanced stats for mock data
         self.company_stats_enhanced = {
@@ -75,6 +508,83 @@ class ExtraordinaryProfileService:
             "airbnb": {"valuation": 75000000000, "employees": 6000, "revenue": 8000000000}
         }
     
+    async def close(self):
+        """Release the Exa and Claude clients' HTTP connections"""
+        if self.exa_client:
+            await self.exa_client.close()
+        if self.claude_client:
+            await self.claude_client.close()
+        if self._exa_cache:
+            cache, self._exa_cache = self._exa_cache, None
+            await asyncio.to_thread(cache.close)
+    
+    async def _get_exa_cache(self) -> ExaResultCache:
+        """Get the persistent Exa response cache, opening it on first use"""
+        if self._exa_cache is None:
+            # Opening creates the database file and schema; keep that off the event loop
+            cache = await asyncio.to_thread(ExaResultCache, self.exa_cache_path)
+            if self._exa_cache is None:
+                self._exa_cache = cache
+            else:
+                # Another search opened it while we were waiting
+                await asyncio.to_thread(cache.close)
+        return self._exa_cache
+    
+    async def _search_exa(self, query: str, **options) -> ExaSearchResponse:
+        """Run one Exa search, waiting for a free concurrency slot first"""
+        cache = await self._get_exa_cache()
+        cache_key = cache.make_key(query, options)
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None:
+            return cached
+        
+        inflight = self._exa_inflight.get(cache_key)
+        if inflight is None:
+            task = asyncio.ensure_future(self._fetch_exa(cache_key, query, options))
+            inflight = self._exa_inflight[cache_key] = _InflightSearch(task)
+            task.add_done_callback(lambda done: self._finish_inflight_search(cache_key, done))
+        
+        inflight.waiters += 1
+        try:
+            # Shielded so one cancelled caller doesn't cancel the search for the others
+            return await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            if inflight.waiters == 0 and not inflight.task.done():
+                # The last caller gave up (e.g. a consumer stopped early): abandon the request,
+                # and let a later caller of the same query start a fresh one
+                inflight.task.cancel()
+                self._forget_inflight_search(cache_key, inflight.task)
+    
+    def _forget_inflight_search(self, cache_key: str, task: asyncio.Task):
+        """Drop an in-flight entry, unless it has already been replaced by a newer search"""
+        inflight = self._exa_inflight.get(cache_key)
+        if inflight is not None and inflight.task is task:
+            del self._exa_inflight[cache_key]
+    
+    def _finish_inflight_search(self, cache_key: str, task: asyncio.Task):
+        """Forget a finished in-flight search"""
+        self._forget_inflight_search(cache_key, task)
+        # Every caller may have moved on (e.g. cancelled); don't let a failure go unretrieved
+        if not task.cancelled():
+            task.exception()
+    
+    async def _fetch_exa(self, cache_key: str, query: str, options: Dict[str, Any]) -> ExaSearchResponse:
+        """Issue one Exa search and store the response in the persistent cache"""
+        async with self._exa_semaphore:
+            response = await self.exa_client.search_and_contents(query=query, **options)
+        
+        cache = await self._get_exa_cache()
+        await asyncio.to_thread(cache.set, cache_key, response)
+        return response
+    
+    def _search_exa_many(self, queries: List[str], **options):
+        """Run Exa searches concurrently, yielding (query, response) in query order
+        
+        A failed query yields its exception in place of the response.
+        """
+        return _outcomes_in_order((query, self._search_exa(query, **options)) for query in queries)
+    
     async def generate_extraordinary_profile(self, request: ProfileGenerationRequest) -> ExtraordinaryProfile:
         """Generate a comprehensive extraordinary profile for a company"""
         logger.info(f"🔍 Generating extraordinary profile for {request.company_name}")
@@ -119,7 +629,7 @@ class ExtraordinaryProfileService:
         research_queries = self._generate_research_queries(company_name, industry, request.research_depth)
         
         # Track research progress
-        profile.research_queries_performed = research_queries
+        profile.research_queries_performed = list(research_queries)
         
         # Perform research in parallel
         research_tasks = []
@@ -143,54 +653,9 @@ class ExtraordinaryProfileService:
         # Execute all research tasks
         await asyncio.gather(*research_tasks, return_exceptions=True)
     
-    def _generate_research_queries(self, company_name: str, industry: str, depth: str) -> List[str]:
+    def _generate_research_queries(self, company_name: str, industry: str, depth: str) -> Tuple[str, ...]:
         """Generate comprehensive research queries based on depth level"""
-        base_queries = [
-            f"{company_name} company profile",
-            f"{company_name} achievements milestones",
-            f"{company_name} awards recognition",
-            f"{company_name} news articles",
-            f"{company_name} funding valuation",
-        ]
-        
-        industry_queries = [
-            f"{company_name} {industry} innovation",
-            f"{company_name} {industry} leadership",
-            f"{company_name} {industry} market share",
-        ]
-        
-        deep_queries = [
-            f"{company_name} CEO founder interview",
-            f"{company_name} technical breakthrough",
-            f"{company_name} patent technology",
-            f"{company_name} customer success stories",
-            f"{company_name} employee growth culture",
-            f"{company_name} social impact sustainability",
-            f"{company_name} competitive advantage",
-            f"{company_name} future roadmap vision",
-        ]
-        
-        comprehensive_queries = [
-            f"{company_name} financial performance metrics",
-            f"{company_name} user adoption statistics",
-            f"{company_name} partnership collaborations",
-            f"{company_name} product launches features",
-            f"{company_name} market expansion international",
-            f"{company_name} research development R&D",
-            f"{company_name} thought leadership content",
-            f"{company_name} industry analysis reports",
-            f"{company_name} customer testimonials reviews",
-            f"{company_name} team expertise talent",
-        ]
-        
-        if depth == "basic":
-            return base_queries[:3]
-        elif depth == "standard":
-            return base_queries + industry_queries[:2]
-        elif depth == "deep":
-            return base_queries + industry_queries + deep_queries[:5]
-        else:  # comprehensive
-            return base_queries + industry_queries + deep_queries + comprehensive_queries
+        return _research_queries(company_name, industry, depth)
     
     async def _research_notable_articles(self, profile: ExtraordinaryProfile, queries: List[str]):
         """Research notable articles about the company using advanced Exa API integration"""
@@ -213,6 +678,8 @@ class ExtraordinaryProfileService:
         
         try:
             articles = []
+            seen_urls = set()
+            seen_content = set()
             profile.total_sources_analyzed = 0
             
             # Enhanced article search queries
@@ -237,48 +704,67 @@ class ExtraordinaryProfileService:
                     f"{profile.company_name} {profile.industry} market share"
                 ])
             
-            for query in article_queries[:self.max_articles_per_query]:
-                try:
-                    # Advanced Exa search with multiple strategies
-                    search_strategies = [
-                        {"type": "neural", "use_autoprompt": True, "num_results": 6},
-                        {"type": "keyword", "num_results": 4}
-                    ]
+            # Advanced Exa search with multiple strategies
+            search_strategies = [
+                {"type": "neural", "use_autoprompt": True, "num_results": 6},
+                {"type": "keyword", "num_results": 4}
+            ]
+            selected_queries = article_queries[:self.max_articles_per_query]
+            
+            # Issue every (query, strategy) search at once and process them in order as they land
+            searches = _outcomes_in_order(
+                ((query, strategy_index), self._search_exa(
+                    query,
+                    **strategy,
+                    text=True,
+                    highlights=True,
+                    start_published_date="2020-01-01",  # Focus on recent content
+                    include_domains=["techcrunch.com", "forbes.com", "bloomberg.com", "reuters.com", "wsj.com", "ft.com", "businessinsider.com"]
+                ))
+                for query in selected_queries
+                for strategy_index, strategy in enumerate(search_strategies)
+            )
+            failed_queries = set()
+            
+            async with aclosing(searches):
+                async for (query, strategy_index), results in searches:
+                    # A query whose first strategy failed is skipped entirely
+                    if query in failed_queries:
+                        continue
                     
-                    for strategy in search_strategies:
-                        results = self.exa_client.search_and_contents(
-                            query=query,
-                            **strategy,
-                            text=True,
-                            highlights=True,
-                            start_published_date="2020-01-01",  # Focus on recent content
-                            include_domains=["techcrunch.com", "forbes.com", "bloomberg.com", "reuters.com", "wsj.com", "ft.com", "businessinsider.com"]
-                        )
+                    try:
+                        if isinstance(results, Exception):
+                            raise results
                         
                         profile.total_sources_analyzed += len(results.results)
                         
                         for result in results.results:
                             article = await self._process_article_result_enhanced(result, profile.company_name)
                             if article and article.relevance_score > self.quality_threshold:
-                                # Check for duplicates
-                                if not any(existing.url == article.url for existing in articles):
-                                    articles.append(article)
-                    
-                    # Add source tracking
-                    source = ResearchSource(
-                        name="Exa API - Articles",
-                        type="exa_api",
-                        url=f"exa.ai/search?q={query}",
-                        reliability_score=0.9
-                    )
-                    profile.sources_used.append(source)
-                    
-                    # Rate limiting
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"Error searching articles for query '{query}': {e}")
-                    continue
+                                # Check for duplicates, including the same story syndicated under another URL
+                                url_key = _canonical_url(article.url)
+                                fingerprint = _content_fingerprint(result.text)
+                                if url_key in seen_urls or fingerprint in seen_content:
+                                    continue
+                                seen_urls.add(url_key)
+                                if fingerprint:
+                                    seen_content.add(fingerprint)
+                                articles.append(article)
+                        
+                        # Add source tracking once the query's last strategy is in
+                        if strategy_index == len(search_strategies) - 1:
+                            source = ResearchSource(
+                                name="Exa API - Articles",
+                                type="exa_api",
+                                url=f"exa.ai/search?q={query}",
+                                reliability_score=0.9
+                            )
+                            profile.sources_used.append(source)
+                        
+                    except Exception as e:
+                        logger.error(f"Error searching articles for query '{query}': {e}")
+                        failed_queries.add(query)
+                        continue
             
             # Enhanced article processing with AI analysis
             if self.claude_client and articles:
@@ -301,18 +787,25 @@ class ExtraordinaryProfileService:
             url = result.url
             text = result.text or ""
             
+            # Lowercase and keyword-scan the body once for all the scoring helpers
+            text_lower = text.lower()
+            text_keywords = _find_keywords(text_lower)
+            company_lower = company_name.lower()
+            
             # Determine article type based on content and source
             article_type = self._classify_article_type(title, text, url)
             
             # Calculate relevance score
-            relevance_score = self._calculate_article_relevance(title, text, company_name)
+            relevance_score = self._calculate_article_relevance(
+                title, text, company_name, text_lower, text_keywords, company_lower
+            )
             
             # Extract summary and key quotes
-            summary = self._extract_article_summary(text, company_name)
+            summary = self._extract_article_summary(text, company_name, text_lower, company_lower)
             key_quotes = self._extract_key_quotes(text, company_name)
             
             # Determine sentiment
-            sentiment = self._analyze_sentiment(title, text)
+            sentiment = self._analyze_sentiment(title, text, text_keywords)
             
             # Extract metadata
             source = self._extract_source_domain(url)
@@ -337,7 +830,6 @@ class ExtraordinaryProfileService:
     def _classify_article_type(self, title: str, text: str, url: str) -> ArticleType:
         """Classify the type of article based on content"""
         title_lower = title.lower()
-        text_lower = text.lower()
         url_lower = url.lower()
         
         if any(term in title_lower for term in ['interview', 'talks with', 'speaks with']):
@@ -353,17 +845,25 @@ class ExtraordinaryProfileService:
         else:
             return ArticleType.NEWS
     
-    def _calculate_article_relevance(self, title: str, text: str, company_name: str) -> float:
+    def _calculate_article_relevance(self, title: str, text: str, company_name: str,
+                                     text_lower: Optional[str] = None,
+                                     text_keywords: Optional[frozenset] = None,
+                                     company_lower: Optional[str] = None) -> float:
         """Calculate how relevant an article is to the company"""
         score = 0.0
+        if text_lower is None:
+            text_lower = text.lower()
+        if text_keywords is None:
+            text_keywords = _find_keywords(text_lower)
+        if company_lower is None:
+            company_lower = company_name.lower()
         
         # Company name mentions
-        company_mentions = title.lower().count(company_name.lower()) + text.lower().count(company_name.lower())
+        company_mentions = title.lower().count(company_lower) + text_lower.count(company_lower)
         score += min(0.4, company_mentions * 0.1)
         
         # Quality indicators
-        quality_terms = ['breakthrough', 'innovation', 'achievement', 'milestone', 'success', 'growth', 'expansion']
-        quality_count = sum(1 for term in quality_terms if term in text.lower())
+        quality_count = len(text_keywords & _QUALITY_TERMS)
         score += min(0.3, quality_count * 0.05)
         
         # Source quality (basic heuristic)
@@ -375,37 +875,57 @@ class ExtraordinaryProfileService:
         
         return min(1.0, score)
     
-    def _extract_article_summary(self, text: str, company_name: str) -> str:
+    def _extract_article_summary(self, text: str, company_name: str, text_lower: Optional[str] = None,
+                                 company_lower: Optional[str] = None) -> str:
         """Extract a relevant summary from article text"""
         if not text:
             return "No summary available"
         
+        if text_lower is None:
+            text_lower = text.lower()
+        needle = company_lower if company_lower is not None else company_name.lower()
+        
         # Find sentences mentioning the company
-        sentences = text.split('.')
-        relevant_sentences = [s.strip() for s in sentences if company_name.lower() in s.lower()]
+        if '.' in needle:
+            # Sentences are split on '.', so a dotted name can never match one
+            relevant_sentences = []
+        elif len(text_lower) == len(text):
+            # Jump between mentions with find() and slice out only the (up to 3)
+            # sentences that contain one, instead of splitting the whole text
+            relevant_sentences = []
+            pos = 0
+            while len(relevant_sentences) < 3:
+                found = text_lower.find(needle, pos)
+                if found < 0:
+                    break
+                start = text_lower.rfind('.', 0, found) + 1
+                end = text_lower.find('.', found)
+                if end < 0:
+                    end = len(text)
+                relevant_sentences.append(text[start:end].strip())
+                pos = end + 1
+        else:
+            # Lowercasing changed the length (e.g. 'İ'), so offsets don't map back to text
+            relevant_sentences = [s.strip() for s in text.split('.') if needle in s.lower()][:3]
         
         if relevant_sentences:
             # Take first 2-3 relevant sentences
-            summary = '. '.join(relevant_sentences[:3])
-            return summary[:500] + "..." if len(summary) > 500 else summary
+            summary = '. '.join(relevant_sentences)
+            return truncate(summary, 500)
         else:
             # Fallback to first paragraph
-            paragraphs = text.split('\n\n')
-            first_paragraph = paragraphs[0] if paragraphs else text[:300]
-            return first_paragraph[:300] + "..." if len(first_paragraph) > 300 else first_paragraph
+            first_paragraph = text.partition('\n\n')[0]
+            return truncate(first_paragraph, 300)
     
     def _extract_key_quotes(self, text: str, company_name: str) -> List[str]:
         """Extract key quotes from article text"""
         quotes = []
         
         # Look for quoted text
-        quote_patterns = [
-            r'"([^"]*' + re.escape(company_name) + r'[^"]*)"',
-            r'"([^"]{50,200})"'  # General quotes of reasonable length
-        ]
+        quote_patterns = (_company_quote_pattern(company_name), _GENERIC_QUOTE_RE)
         
         for pattern in quote_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             quotes.extend(matches[:2])  # Limit quotes per pattern
         
         # Clean and filter quotes
@@ -416,15 +936,16 @@ class ExtraordinaryProfileService:
         
         return cleaned_quotes[:5]  # Return top 5 quotes
     
-    def _analyze_sentiment(self, title: str, text: str) -> str:
+    def _analyze_sentiment(self, title: str, text: str, text_keywords: Optional[frozenset] = None) -> str:
         """Basic sentiment analysis"""
-        positive_terms = ['success', 'growth', 'breakthrough', 'achievement', 'innovation', 'expansion', 'milestone']
-        negative_terms = ['challenge', 'problem', 'decline', 'loss', 'controversy', 'criticism', 'failure']
-        
-        content = (title + " " + text).lower()
+        if text_keywords is None:
+            keywords = _find_keywords((title + " " + text).lower())
+        else:
+            # No keyword contains a space, so none can straddle the title/text join
+            keywords = text_keywords | _find_keywords(title.lower())
         
-        positive_count = sum(1 for term in positive_terms if term in content)
-        negative_count = sum(1 for term in negative_terms if term in content)
+        positive_count = len(keywords & _POSITIVE_TERMS)
+        negative_count = len(keywords & _NEGATIVE_TERMS)
         
         if positive_count > negative_count + 1:
             return "positive"
@@ -481,28 +1002,30 @@ class ExtraordinaryProfileService:
                 f"{profile.company_name} Forbes Fortune ranking"
             ]
             
-            for query in recognition_queries:
-                try:
-                    results = self.exa_client.search_and_contents(
-                        query=query,
-                        type="neural",
-                        use_autoprompt=True,
-                        num_results=5,
-                        text=True,
-                        start_published_date="2018-01-01",
-                        include_domains=["forbes.com", "fortune.com", "techcrunch.com", "bloomberg.com", "fastcompany.com", "inc.com"]
-                    )
-                    
-                    for result in results.results:
-                        recognition = await self._extract_recognition_from_content(result, profile.company_name)
-                        if recognition:
-                            recognitions.append(recognition)
-                    
-                    await asyncio.sleep(0.3)  # Rate limiting
-                    
-                except Exception as e:
-                    logger.error(f"Error searching recognitions for query '{query}': {e}")
-                    continue
+            search_results = self._search_exa_many(
+                recognition_queries,
+                type="neural",
+                use_autoprompt=True,
+                num_results=5,
+                text=True,
+                start_published_date="2018-01-01",
+                include_domains=["forbes.com", "fortune.com", "techcrunch.com", "bloomberg.com", "fastcompany.com", "inc.com"]
+            )
+            
+            async with aclosing(search_results):
+                async for query, results in search_results:
+                    try:
+                        if isinstance(results, Exception):
+                            raise results
+                        
+                        for result in results.results:
+                            recognition = await self._extract_recognition_from_content(result, profile.company_name)
+                            if recognition:
+                                recognitions.append(recognition)
+                        
+                    except Exception as e:
+                        logger.error(f"Error searching recognitions for query '{query}': {e}")
+                        continue
             
             # Remove duplicates and sort by significance
             unique_recognitions = []
@@ -557,32 +1080,46 @@ class ExtraordinaryProfileService:
             ]
             
             feat_content = []
+            seen_content = set()
             
-            for query in feats_queries:
-                try:
-                    results = self.exa_client.search_and_contents(
-                        query=query,
-                        type="neural",
-                        use_autoprompt=True,
-                        num_results=4,
-                        text=True,
-                        start_published_date="2019-01-01"
-                    )
-                    
-                    for result in results.results:
-                        if result.text and len(result.text) > 200:
-                            feat_content.append({
-                                'title': result.title,
-                                'text': result.text,
-                                'url': result.url,
-                                'query': query
-                            })
-                    
-                    await asyncio.sleep(0.3)
+            search_results = self._search_exa_many(
+                feats_queries,
+                type="neural",
+                use_autoprompt=True,
+                num_results=4,
+                text=True,
+                start_published_date="2019-01-01"
+            )
+            
+            async with aclosing(search_results):
+                async for query, results in search_results:
+                    # Only the first few passages are sent to Claude; stop searching once we have them
+                    if len(feat_content) >= self.max_feat_passages:
+                        break
                     
-                except Exception as e:
-                    logger.error(f"Error searching feats for query '{query}': {e}")
-                    continue
+                    try:
+                        if isinstance(results, Exception):
+                            raise results
+                        
+                        for result in results.results:
+                            if len(feat_content) >= self.max_feat_passages:
+                                break
+                            if result.text and len(result.text) > 200:
+                                # Overlapping queries return the same passages; only send Claude one copy
+                                fingerprint = _content_fingerprint(result.text)
+                                if fingerprint in seen_content:
+                                    continue
+                                seen_content.add(fingerprint)
+                                feat_content.append({
+                                    'title': result.title,
+                                    'text': result.text,
+                                    'url': result.url,
+                                    'query': query
+                                })
+                        
+                    except Exception as e:
+                        logger.error(f"Error searching feats for query '{query}': {e}")
+                        continue
             
             # Use AI to analyze and extract extraordinary feats
             if self.claude_client and feat_content:
@@ -624,26 +1161,38 @@ class ExtraordinaryProfileService:
                 ]
                 
                 stats_content = []
+                seen_content = set()
                 
-                for query in stats_queries:
-                    try:
-                        results = self.exa_client.search_and_contents(
-                            query=query,
-                            type="neural",
-                            num_results=3,
-                            text=True,
-                            include_domains=["crunchbase.com", "pitchbook.com", "bloomberg.com", "reuters.com"]
-                        )
-                        
-                        for result in results.results:
-                            if result.text:
-                                stats_content.append(result.text)
-                        
-                        await asyncio.sleep(0.3)
+                search_results = self._search_exa_many(
+                    stats_queries,
+                    type="neural",
+                    num_results=3,
+                    text=True,
+                    include_domains=["crunchbase.com", "pitchbook.com", "bloomberg.com", "reuters.com"]
+                )
+                
+                async with aclosing(search_results):
+                    async for query, results in search_results:
+                        if len(stats_content) >= self.max_stats_passages:
+                            break
                         
-                    except Exception as e:
-                        logger.error(f"Error searching stats for query '{query}': {e}")
-                        continue
+                        try:
+                            if isinstance(results, Exception):
+                                raise results
+                            
+                            for result in results.results:
+                                if len(stats_content) >= self.max_stats_passages:
+                                    break
+                                if result.text:
+                                    fingerprint = _content_fingerprint(result.text)
+                                    if fingerprint in seen_content:
+                                        continue
+                                    seen_content.add(fingerprint)
+                                    stats_content.append(result.text)
+                            
+                        except Exception as e:
+                            logger.error(f"Error searching stats for query '{query}': {e}")
+                            continue
                 
                 # Extract statistics using AI
                 if self.claude_client and stats_content:
@@ -660,25 +1209,55 @@ class ExtraordinaryProfileService:
         """Update an existing profile with new research"""
         logger.info(f"Updating existing profile for {profile.company_name}")
         
-        # Update timestamp
-        profile.last_updated = datetime.now()
+        # Profiles are refreshed weekly; a fresh one is returned as-is
+        if datetime.now() - profile.last_updated <= timedelta(days=7):
+            return profile
         
-        # Perform incremental research if needed
-        if datetime.now() - profile.last_updated > timedelta(days=7):  # Weekly updates
-            await self._conduct_deep_research(profile, request)
-            profile.calculate_profile_scores()
-            await self.save_profile(profile)
+        # Update timestamp and perform incremental research
+        profile.last_updated = datetime.now()
+        await self._conduct_deep_research(profile, request)
+        profile.calculate_profile_scores()
+        await self.save_profile(profile)
         
         return profile
     
+    def _get_cached_profile(self, company_id: str) -> Optional[ExtraordinaryProfile]:
+        """Copy of a cached profile, or None if missing or expired"""
+        entry = self._profile_cache.get(company_id)
+        if entry is None:
+            return None
+        
+        expires_at, profile = entry
+        if expires_at <= time.monotonic():
+            del self._profile_cache[company_id]
+            return None
+        
+        self._profile_cache.move_to_end(company_id)
+        # Callers update loaded profiles in place, so never hand out the cached one
+        return profile.model_copy(deep=True)
+    
+    def _cache_profile(self, profile: ExtraordinaryProfile):
+        """Remember a profile for the cache TTL"""
+        self._profile_cache[profile.company_id] = (
+            time.monotonic() + self._profile_cache_ttl, profile.model_copy(deep=True)
+        )
+        self._profile_cache.move_to_end(profile.company_id)
+        if len(self._profile_cache) > self._profile_cache_size:
+            self._profile_cache.popitem(last=False)
+    
     async def load_profile(self, company_id: str) -> Optional[ExtraordinaryProfile]:
         """Load an existing profile from storage"""
+        cached = self._get_cached_profile(company_id)
+        if cached is not None:
+            return cached
+        
         try:
             profile_file = self.profiles_dir / f"{company_id}.json"
-            if profile_file.exists():
-                with open(profile_file, 'r') as f:
-                    data = json.load(f)
-                    return ExtraordinaryProfile(**data)
+            profile = await asyncio.to_thread(_read_profile_file, profile_file)
+            self._cache_profile(profile)
+            return profile
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.error(f"Error loading profile for {company_id}: {e}")
         
@@ -688,40 +1267,142 @@ class ExtraordinaryProfileService:
         """Save profile to storage"""
         try:
             profile_file = self.profiles_dir / f"{profile.company_id}.json"
-            with open(profile_file, 'w') as f:
-                json.dump(profile.dict(), f, indent=2, default=str)
+            data = _dump_profile(profile.dict())
+            await asyncio.to_thread(_write_profile_file, profile_file, data)
+            self._cache_profile(profile)
             logger.info(f"Saved profile for {profile.company_name}")
         except Exception as e:
             logger.error(f"Error saving profile: {e}")
     
     async def get_all_profiles(self) -> List[ExtraordinaryProfile]:
         """Get all generated profiles"""
-        profiles = []
-        try:
-            for profile_file in self.profiles_dir.glob("*.json"):
-                with open(profile_file, 'r') as f:
-                    data = json.load(f)
-                    profiles.append(ExtraordinaryProfile(**data))
-        except Exception as e:
-            logger.error(f"Error loading profiles: {e}")
+        return await self._read_profile_files(list(self.profiles_dir.glob("*.json")))
+    
+    async def _read_profile_files(self, profile_files: List[Path]) -> List[ExtraordinaryProfile]:
+        """Read profile files concurrently in worker threads, skipping unreadable ones"""
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_read_profile_file, profile_file) for profile_file in profile_files),
+            return_exceptions=True
+        )
         
+        profiles = []
+        for profile_file, result in zip(profile_files, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error loading profile {profile_file.name}: {result}")
+            else:
+                profiles.append(result)
         return profiles
     
+    def _refresh_profile_index(self) -> _ProfileSearchColumns:
+        """Bring the search index up to date with the profiles directory (blocking; run in a worker thread)
+        
+        Only files whose modification time or size changed since the last refresh are
+        re-read, and the search columns are only rebuilt when something changed.
+        """
+        with self._profile_index_lock:
+            return self._refresh_profile_index_locked()
+    
+    def _refresh_profile_index_locked(self) -> _ProfileSearchColumns:
+        """Body of _refresh_profile_index; the caller holds the index lock"""
+        entries = []
+        current_names = set()
+        changed = False
+        for profile_file in self.profiles_dir.glob("*.json"):
+            current_names.add(profile_file.name)
+            try:
+                stat = profile_file.stat()
+                entry = self._profile_index.get(profile_file.name)
+                if entry is None or (entry.mtime_ns, entry.size) != (stat.st_mtime_ns, stat.st_size):
+                    changed = True
+                    data = orjson.loads(profile_file.read_bytes())
+                    entry = _ProfileIndexEntry(
+                        mtime_ns=stat.st_mtime_ns,
+                        size=stat.st_size,
+                        company_name_lower=data["company_name"].lower(),
+                        industry_lower=data["industry"].lower(),
+                        overall_profile_score=data.get("overall_profile_score", 0.0)
+                    )
+                    self._profile_index[profile_file.name] = entry
+                entries.append((profile_file, entry))
+            except Exception as e:
+                logger.error(f"Error indexing profile {profile_file.name}: {e}")
+        
+        # Forget profiles that were deleted
+        for name in self._profile_index.keys() - current_names:
+            del self._profile_index[name]
+            changed = True
+        
+        files = [profile_file for profile_file, _ in entries]
+        if changed or self._profile_columns is None or self._profile_columns.files != files:
+            self._profile_columns = _ProfileSearchColumns(
+                files=files,
+                company_names_lower=np.array([entry.company_name_lower for _, entry in entries], dtype=str),
+                industries_lower=np.array([entry.industry_lower for _, entry in entries], dtype=str),
+                overall_profile_scores=np.array([entry.overall_profile_score for _, entry in entries], dtype=float)
+            )
+        return self._profile_columns
+    
     async def search_profiles(self, query: str, min_score: float = 0.0) -> List[ExtraordinaryProfile]:
         """Search profiles based on query"""
-        all_profiles = await self.get_all_profiles()
+        query_lower = query.lower()
+        
+        # Simple text-based search over the index columns; only matches are fully loaded
+        columns = await asyncio.to_thread(self._refresh_profile_index)
+        matches = np.flatnonzero(
+            (np.char.find(columns.company_names_lower, query_lower) >= 0) |
+            (np.char.find(columns.industries_lower, query_lower) >= 0) |
+            (columns.overall_profile_scores >= min_score)
+        )
         
-        # Simple text-based search
-        matching_profiles = []
-        for profile in all_profiles:
-            if (query.lower() in profile.company_name.lower() or 
-                query.lower() in profile.industry.lower() or
-                profile.overall_profile_score >= min_score):
-                matching_profiles.append(profile)
+        # Sort by profile score (stable, so ties keep directory order)
+        order = matches[np.argsort(-columns.overall_profile_scores[matches], kind="stable")]
         
-        # Sort by profile score
-        matching_profiles.sort(key=lambda x: x.overall_profile_score, reverse=True)
-        return matching_profiles
+        return await self._read_profile_files([columns.files[index] for index in order])
+    
+    async def _create_claude_message(self, **request):
+        """Send one Claude request, waiting for a free concurrency slot and rate budget first"""
+        async with self._claude_semaphore:
+            await self._claude_request_limiter.acquire()
+            await self._claude_token_limiter.acquire(_estimated_claude_tokens(request))
+            return await self.claude_client.messages.create(**request)
+    
+    def _get_cached_claude_reply(self, cache_key: str) -> Optional[str]:
+        """Cached Claude reply text, or None if missing or expired"""
+        entry = self._claude_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        expires_at, reply = entry
+        if expires_at <= time.monotonic():
+            del self._claude_cache[cache_key]
+            return None
+        
+        self._claude_cache.move_to_end(cache_key)
+        return reply
+    
+    def _cache_claude_reply(self, cache_key: str, reply: str):
+        """Remember a Claude reply for the cache TTL"""
+        self._claude_cache[cache_key] = (time.monotonic() + self._claude_cache_ttl, reply)
+        self._claude_cache.move_to_end(cache_key)
+        if len(self._claude_cache) > self._claude_cache_size:
+            self._claude_cache.popitem(last=False)
+    
+    async def _claude_json(self, **request) -> Any:
+        """Send a Claude request and parse its JSON reply, reusing the reply to an identical request"""
+        # Keyed on the whole request (model, token limit, prompt)
+        cache_key = hashlib.blake2b(orjson.dumps(request, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+        reply = self._get_cached_claude_reply(cache_key)
+        if reply is not None:
+            return _parse_json_reply(reply)
+        
+        response = await self._create_claude_message(**request)
+        reply = response.content[0].text
+        result = _parse_json_reply(reply)
+        # Only replies that parsed to an object are cached, so a malformed one
+        # (or a bare list/string the callers can't use) is retried next time
+        if isinstance(result, dict):
+            self._cache_claude_reply(cache_key, reply)
+        return result
     
     async def _enhance_articles_with_ai(self, articles: List[NotableArticle], company_name: str) -> List[NotableArticle]:
         """Enhance articles with AI-powered analysis"""
@@ -729,51 +1410,82 @@ class ExtraordinaryProfileService:
             return articles
         
         try:
-            for article in articles:
-                if article.summary and len(article.summary) > 100:
-                    # Enhance summary and extract better quotes
-                    enhanced_data = await self._analyze_article_with_claude(article, company_name)
-                    if enhanced_data:
-                        article.summary = enhanced_data.get('enhanced_summary', article.summary)
-                        article.key_quotes = enhanced_data.get('key_quotes', article.key_quotes)
-                        article.relevance_score = min(1.0, article.relevance_score + enhanced_data.get('relevance_boost', 0))
+            eligible = [article for article in articles if article.summary and len(article.summary) > 100]
+            if not eligible:
+                return articles
+            
+            # One Claude request per batch of articles, with the batches analyzed concurrently
+            batches = [
+                eligible[start:start + self.claude_batch_size]
+                for start in range(0, len(eligible), self.claude_batch_size)
+            ]
+            batch_analyses = await asyncio.gather(
+                *(self._analyze_articles_with_claude(batch, company_name) for batch in batches)
+            )
+            
+            for batch, analyses in zip(batches, batch_analyses):
+                # Enhance summary and extract better quotes
+                for article_id, enhanced_data in analyses.items():
+                    article = batch[article_id]
+                    article.summary = enhanced_data.get('enhanced_summary', article.summary)
+                    article.key_quotes = enhanced_data.get('key_quotes', article.key_quotes)
+                    article.relevance_score = min(1.0, article.relevance_score + enhanced_data.get('relevance_boost', 0))
             
             return articles
         except Exception as e:
             logger.error(f"Error enhancing articles with AI: {e}")
             return articles
     
-    async def _analyze_article_with_claude(self, article: NotableArticle, company_name: str) -> Optional[Dict[str, Any]]:
-        """Analyze article content with Claude AI"""
+    async def _analyze_articles_with_claude(self, articles: List[NotableArticle], company_name: str) -> Dict[int, Dict[str, Any]]:
+        """Analyze a batch of articles in one Claude request, keyed by position in the batch"""
         try:
+            articles_json = json.dumps(
+                [
+                    {"id": article_id, "title": article.title, "content": _prompt_snippet(article.summary, 1000)}
+                    for article_id, article in enumerate(articles)
+                ],
+                ensure_ascii=False,
+                indent=2
+            )
+            
             prompt = f"""
-            Analyze this article about {company_name} and provide:
+            Analyze each of these articles about {company_name} and for every article provide:
             1. An enhanced summary (2-3 sentences) focusing on what makes this company extraordinary
             2. Extract 2-3 key quotes that highlight achievements, innovations, or impressive metrics
             3. Rate the relevance to extraordinary achievements (0.0-0.3 boost)
             
-            Article Title: {article.title}
-            Article Content: {article.summary[:1000]}...
+            Articles:
+            {articles_json}
             
-            Respond in JSON format:
+            Respond in JSON format with one result per article id:
             {{
-                "enhanced_summary": "...",
-                "key_quotes": ["quote1", "quote2"],
-                "relevance_boost": 0.1
+                "results": [
+                    {{
+                        "id": 0,
+                        "enhanced_summary": "...",
+                        "key_quotes": ["quote1", "quote2"],
+                        "relevance_boost": 0.1
+                    }}
+                ]
             }}
             """
             
-            response = self.claude_client.messages.create(
+            result = await self._claude_json(
                 model="claude-3-haiku-20240307",
-                max_tokens=500,
+                max_tokens=min(4096, 500 * len(articles)),
                 messages=[{"role": "user", "content": prompt}]
             )
             
-            return json.loads(response.content[0].text)
+            analyses = {}
+            for item in result.get('results', []):
+                article_id = item.get('id')
+                if isinstance(article_id, int) and 0 <= article_id < len(articles):
+                    analyses[article_id] = item
+            return analyses
             
         except Exception as e:
-            logger.error(f"Error analyzing article with Claude: {e}")
-            return None
+            logger.error(f"Error analyzing articles with Claude: {e}")
+            return {}
     
     async def _extract_recognition_from_content(self, result, company_name: str) -> Optional[Recognition]:
         """Extract recognition information from search results"""
@@ -782,24 +1494,18 @@ class ExtraordinaryProfileService:
             text = result.text or ""
             url = result.url
             
-            # Look for recognition patterns
-            recognition_patterns = [
-                r'(\d{4}).*?award.*?' + re.escape(company_name),
-                r'' + re.escape(company_name) + r'.*?ranked.*?(\d+)',
-                r'' + re.escape(company_name) + r'.*?winner.*?(\d{4})',
-                r'top.*?(\d+).*?' + re.escape(company_name),
-            ]
-            
             # Extract year and ranking info
             year = 2024  # Default
             rank_position = None
             
-            for pattern in recognition_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                if matches:
+            # Look for recognition patterns; only each pattern's first match is used,
+            # so search() stops there instead of findall() scanning the whole text
+            for pattern in _recognition_patterns(company_name):
+                match = pattern.search(text)
+                if match:
                     try:
-                        if matches[0].isdigit():
-                            potential_year = int(matches[0])
+                        if match.group(1).isdigit():
+                            potential_year = int(match.group(1))
                             if 2015 <= potential_year <= 2024:
                                 year = potential_year
                             elif potential_year < 100:  # Likely a ranking
@@ -811,28 +1517,27 @@ class ExtraordinaryProfileService:
             recognition_type = RecognitionType.AWARD
             significance_score = 0.5
             
-            if any(term in title.lower() for term in ['top', 'best', 'ranking']):
+            title_lower = title.lower()
+            if any(term in title_lower for term in _RANKING_TERMS):
                 recognition_type = RecognitionType.RANKING
                 significance_score = 0.7
             
-            if any(term in title.lower() for term in ['forbes', 'fortune', 'techcrunch']):
+            if any(term in title_lower for term in _PRESTIGE_OUTLETS):
                 significance_score = min(1.0, significance_score + 0.2)
             
             # Extract organization name
-            organization = self._extract_source_domain(url)
-            if 'forbes' in organization:
-                organization = 'Forbes'
-            elif 'fortune' in organization:
-                organization = 'Fortune'
-            elif 'techcrunch' in organization:
-                organization = 'TechCrunch'
+            domain = self._extract_source_domain(url)
+            organization = next(
+                (name for term, name in _PRESTIGE_OUTLETS.items() if term in domain),
+                domain
+            )
             
             return Recognition(
                 title=title[:100],  # Truncate long titles
                 organization=organization,
                 year=year,
                 recognition_type=recognition_type,
-                description=text[:300] + "..." if len(text) > 300 else text,
+                description=truncate(text, 300),
                 url=url,
                 rank_position=rank_position,
                 significance_score=significance_score
@@ -844,12 +1549,15 @@ class ExtraordinaryProfileService:
     
     async def _extract_feats_with_ai(self, feat_content: List[Dict], company_name: str) -> List[ExtraordinaryFeat]:
         """Extract extraordinary feats using Claude AI analysis"""
-        if not self.claude_client:
+        if not self.claude_client or not feat_content:
             return []
         
         try:
             # Combine content for analysis
-            combined_content = "\n\n".join([f"Title: {item['title']}\nContent: {item['text'][:800]}" for item in feat_content[:5]])
+            combined_content = "\n\n".join(
+                f"Title: {item['title']}\nContent: {_prompt_snippet(item['text'], 800)}"
+                for item in feat_content[:self.max_feat_passages]
+            )
             
             prompt = f"""
             Analyze the following content about {company_name} and identify extraordinary feats or achievements.
@@ -878,13 +1586,11 @@ class ExtraordinaryProfileService:
             }}
             """
             
-            response = self.claude_client.messages.create(
+            result = await self._claude_json(
                 model="claude-3-haiku-20240307",
                 max_tokens=1500,
                 messages=[{"role": "user", "content": prompt}]
             )
-            
-            result = json.loads(response.content[0].text)
             feats = []
             
             for feat_data in result.get('feats', []):
@@ -912,11 +1618,11 @@ class ExtraordinaryProfileService:
     
     async def _extract_stats_with_ai(self, stats_content: List[str], company_name: str) -> CompanyStats:
         """Extract company statistics using Claude AI"""
-        if not self.claude_client:
+        if not self.claude_client or not stats_content:
             return CompanyStats()
         
         try:
-            combined_content = "\n\n".join(stats_content[:3])
+            combined_content = "\n\n".join(stats_content[:self.max_stats_passages])
             
             prompt = f"""
             Extract quantitative statistics about {company_name} from the following content.
@@ -937,14 +1643,12 @@ class ExtraordinaryProfileService:
             }}
             """
             
-            response = self.claude_client.messages.create(
+            stats_data = await self._claude_json(
                 model="claude-3-haiku-20240307",
                 max_tokens=500,
                 messages=[{"role": "user", "content": prompt}]
             )
             
-            stats_data = json.loads(response.content[0].text)
-            
             return CompanyStats(
                 valuation=stats_data.get('valuation'),
                 revenue=stats_data.get('revenue'),
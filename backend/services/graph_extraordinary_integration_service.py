@@ -31,6 +31,16 @@ class GraphExtraordinaryIntegrationService:
         self.profile_service = ExtraordinaryProfileService(exa_api_key=actual_exa_key)
         self.graph_data_path = Path(__file__).parent.parent.parent / "data_agent" / "data_agent" / "output" / "graph_data_for_frontend.json"
         
+    async def __aenter__(self):
+        return self
+        
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def close(self):
+        """Release the profile service's HTTP connections and result cache"""
+        await self.profile_service.close()
+        
     async def enhance_graph_with_extraordinary_profiles(self, 
                                                        max_companies: int = 10, 
                                                        force_regenerate: bool = False,
@@ -365,13 +375,13 @@ class GraphExtraordinaryIntegrationService:
 # Convenience functions for easy usage
 async def enhance_all_companies(max_companies: int = 10, exa_api_key: str = None) -> Dict[str, Any]:
     """Enhance all companies in graph with extraordinary profiles"""
-    service = GraphExtraordinaryIntegrationService(exa_api_key=exa_api_key)
-    return await service.enhance_graph_with_extraordinary_profiles(max_companies=max_companies)
+    async with GraphExtraordinaryIntegrationService(exa_api_key=exa_api_key) as service:
+        return await service.enhance_graph_with_extraordinary_profiles(max_companies=max_companies)
 
 async def enhance_specific_companies(company_names: List[str], exa_api_key: str = None) -> Dict[str, Any]:
     """Enhance specific companies with extraordinary profiles"""
-    service = GraphExtraordinaryIntegrationService(exa_api_key=exa_api_key)
-    return await service.enhance_graph_with_extraordinary_profiles(
-        target_companies=company_names,
-        max_companies=len(company_names)
-    )
+    async with GraphExtraordinaryIntegrationService(exa_api_key=exa_api_key) as service:
+        return await service.enhance_graph_with_extraordinary_profiles(
+            target_companies=company_names,
+            max_companies=len(company_names)
+        )
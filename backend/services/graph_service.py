@@ -50,11 +50,12 @@ class GraphService:
             self.graph.add_node(company.id, **node.dict())
         
         # Create edges for deals
+        company_ids = {company.id for company in companies}
         edges = []
         for deal in deals:
             # Skip if companies don't exist
-            if deal.source_company_id not in [c.id for c in companies] or \
-               deal.target_company_id not in [c.id for c in companies]:
+            if deal.source_company_id not in company_ids or \
+               deal.target_company_id not in company_ids:
                 continue
             
             # Edge weight based on deal value
@@ -141,16 +142,14 @@ class GraphService:
     
     async def remove_company_node(self, company_id: str) -> Dict[str, Any]:
         """Remove a company node from the graph"""
-        if company_id in self.data_service.companies_db:
-            del self.data_service.companies_db[company_id]
+        if self.data_service.remove_company(company_id):
             
             # Remove related deals
             deals_to_remove = [
-                deal_id for deal_id, deal in self.data_service.deals_db.items()
-                if deal.source_company_id == company_id or deal.target_company_id == company_id
+                deal.id for deal in self.data_service.get_deals_for_company(company_id)
             ]
             for deal_id in deals_to_remove:
-                del self.data_service.deals_db[deal_id]
+                self.data_service.remove_deal(deal_id)
             
             return {"success": True, "message": f"Removed company {company_id} and {len(deals_to_remove)} related deals"}
         
@@ -163,8 +162,7 @@ class GraphService:
     
     async def remove_deal_edge(self, deal_id: str) -> Dict[str, Any]:
         """Remove a deal edge from the graph"""
-        if deal_id in self.data_service.deals_db:
-            del self.data_service.deals_db[deal_id]
+        if self.data_service.remove_deal(deal_id):
             return {"success": True, "message": f"Removed deal {deal_id}"}
         
         return {"success": False, "message": "Deal not found"}
@@ -175,12 +173,7 @@ class GraphService:
             return {"error": "Company not found"}
         
         company = self.data_service.companies_db[company_id]
-        deals = await self.data_service.get_deals()
-        
-        connections = [
-            deal for deal in deals
-            if deal.source_company_id == company_id or deal.target_company_id == company_id
-        ]
+        connections = self.data_service.get_deals_for_company(company_id)
         
         return {
             "company": company,
@@ -0,0 +1,46 @@
+"""
+Small helpers shared by the research services
+"""
+
+import asyncio
+import time
+
+
+def truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis"""
+    return f"{text[:limit]}..." if len(text) > limit else text
+
+
+class TokenBucket:
+    """Async token bucket refilling `rate` tokens per `period` seconds, holding at most `rate`"""
+    
+    def __init__(self, rate: float, period: float = 1.0):
+        self.capacity = rate
+        self._tokens = rate
+        self._fill_rate = rate / period
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, amount: float = 1):
+        """Wait until `amount` tokens are available and take them"""
+        # A draw larger than the bucket could never be served; it waits for a full bucket instead
+        amount = min(amount, self.capacity)
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._fill_rate)
+                self._updated = now
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self._fill_rate)
+    
+    def pause(self, seconds: float):
+        """Hold back every acquire for the given time (e.g. after a 429)"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Services import their siblings as top-level packages (models, services), as when run from backend/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,214 @@
+import asyncio
+import itertools
+import random
+from datetime import datetime
+
+import pytest
+
+from models.schemas import Company, DealType, NewsData
+import services.data_ingestion as data_ingestion
+from services.data_ingestion import DataIngestionService
+
+
+def _baseline_mentions(service, text):
+    """Original extraction: every company whose name occurs in the text, in companies_db order"""
+    return [
+        company.name
+        for company in service.companies_db.values()
+        if company.name.lower() in text.lower()
+    ]
+
+
+@pytest.fixture
+def service():
+    return DataIngestionService()
+
+
+@pytest.fixture(params=[True, False], ids=["automaton", "fallback"])
+def matcher_service(request, monkeypatch):
+    """Service using the Aho-Corasick matcher, or the fallback used without pyahocorasick"""
+    if request.param and not data_ingestion.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick is not installed")
+    monkeypatch.setattr(data_ingestion, "AHOCORASICK_AVAILABLE", request.param)
+    return DataIngestionService()
+
+
+MENTION_TEXTS = [
+    "Meta Platforms and Metaplex",
+    "Metaplex partners with Meta",
+    "Anthropic and OpenAI talk; Microsoft Corporation watches",
+    "anthropic partners with microsoft corporation",
+    "Meta Platforms eyes Alphabet Inc. deal",
+    "Nothing relevant here",
+    "OPENAI OPENAI anthropic",
+]
+
+
+@pytest.mark.parametrize("text", MENTION_TEXTS)
+def test_mentions_follow_companies_db_order(matcher_service, text):
+    service = matcher_service
+    service.add_company(Company(id="meta_short", name="Meta", industry="Social Media"))
+    service.add_company(Company(id="metaplex", name="Metaplex", industry="Crypto"))
+    assert service._extract_companies_from_text(text) == _baseline_mentions(service, text)
+
+
+def test_deal_direction_ignores_text_order(service):
+    news = NewsData(
+        title="Anthropic to acquire stake from OpenAI",
+        content="",
+        source="Test",
+        published_date=datetime(2024, 1, 1),
+        url="https://example.com/a",
+        companies_mentioned=service._extract_companies_from_text("Anthropic to acquire stake from OpenAI"),
+    )
+    deals = asyncio.run(service.process_news_to_deals([news]))
+    assert (deals[0].source_company_id, deals[0].target_company_id) == ("openai", "anthropic")
+
+
+def test_readded_company_moves_to_end(service):
+    company = service.companies_db["openai"]
+    service.remove_company("openai")
+    service.add_company(company)
+    text = "OpenAI and Anthropic"
+    assert service._extract_companies_from_text(text) == _baseline_mentions(service, text)
+
+
+@pytest.mark.parametrize("headline, expected", [
+    ("Oracle emerges as acquirer of Cerner", DealType.ACQUISITION),
+    ("Board approves share rebuys", DealType.ACQUISITION),
+    ("Fund to reinvest profits in startups", DealType.INVESTMENT),
+    ("Mergers slow in Q3", DealType.MERGER),
+    ("Weather around the bay", DealType.INVESTMENT),
+    ("Quarterly earnings beat estimates", None),
+])
+def test_deal_keywords_match_as_substrings(service, headline, expected):
+    assert service._classify_deal_type(headline) == expected
+
+
+def _baseline_deal_type(text):
+    """Original classifier: keyword containment checked type by type in priority order"""
+    text = text.lower()
+    if any(word in text for word in ["acquire", "acquisition", "buys", "purchased"]):
+        return DealType.ACQUISITION
+    elif any(word in text for word in ["merge", "merger"]):
+        return DealType.MERGER
+    elif any(word in text for word in ["partner", "partnership", "collaborate"]):
+        return DealType.PARTNERSHIP
+    elif any(word in text for word in ["invest", "investment", "funding", "round"]):
+        return DealType.INVESTMENT
+    return None
+
+
+_HEADLINE_WORDS = [
+    "Acquirer", "acquires", "buys", "buyouts", "rebuys", "purchased", "MERGERS", "emerges",
+    "partnered", "partnerround", "collaborates", "reinvest", "funding", "around", "Series B",
+    "stake", "deal", "Microsoft", "OpenAI", "talks", "quarterly", "earnings", "-", "$10B",
+]
+
+
+def test_deal_type_matches_baseline_on_sample_headlines(service):
+    rng = random.Random(19)
+    headlines = [" ".join(pair) for pair in itertools.product(_HEADLINE_WORDS, repeat=2)]
+    headlines += [
+        "".join(rng.choice(_HEADLINE_WORDS) for _ in range(rng.randint(0, 6)))
+        for _ in range(2000)
+    ]
+    for headline in headlines:
+        assert service._classify_deal_type(headline) == _baseline_deal_type(headline), headline
+
+
+def test_extraordinary_factors_follow_in_place_score_change(service):
+    company = service.companies_db["meta"]
+    assert service._get_extraordinary_factors(company)
+    company.extraordinary_score = 0.5
+    assert service._get_extraordinary_factors(company) == ()
+    company.extraordinary_score = 0.9
+    assert service._get_extraordinary_factors(company)
+
+
+def test_profile_changes_by_caller_do_not_reach_cache(service):
+    profile = asyncio.run(service.get_company_profile("OpenAI"))
+    profile["connections"].clear()
+    profile["financial_metrics"]["revenue_growth"] = -1
+    profile["extraordinary_factors"].append("Tampered")
+    profile["news_sentiment"] = 0
+    
+    again = asyncio.run(service.get_company_profile("OpenAI"))
+    assert [deal.id for deal in again["connections"]] == ["deal_1"]
+    assert again["financial_metrics"]["revenue_growth"] == 0.15
+    assert "Tampered" not in again["extraordinary_factors"]
+    assert again["news_sentiment"] == 0.75
+
+
+def test_profile_reflects_company_updates(service):
+    assert asyncio.run(service.get_company_profile("Meta Platforms"))["extraordinary_factors"]
+    
+    # Changed in place on the stored object
+    service.companies_db["meta"].extraordinary_score = 0.5
+    assert asyncio.run(service.get_company_profile("Meta Platforms"))["extraordinary_factors"] == []
+    
+    # Changed through the service
+    service.update_company("meta", name="Meta", extraordinary_score=0.9)
+    profile = asyncio.run(service.get_company_profile("Meta"))
+    assert profile["company"].name == "Meta"
+    assert profile["extraordinary_factors"]
+    with pytest.raises(ValueError):
+        asyncio.run(service.get_company_profile("Meta Platforms"))
+    assert service._extract_companies_from_text("Meta Platforms and Meta") == ["Meta"]
+
+
+def test_identical_newsapi_requests_share_one_call_and_are_forgotten(service):
+    calls = []
+    
+    async def fake_request(query, from_date):
+        calls.append((query, from_date))
+        await asyncio.sleep(0.01)
+        if query == "fail":
+            raise RuntimeError("rateLimited")
+        return {"status": "ok", "articles": [query]}
+    
+    service._request_newsapi = fake_request
+    
+    async def run():
+        results = await asyncio.gather(
+            service._fetch_newsapi_articles("merger", "2024-01-01"),
+            service._fetch_newsapi_articles("merger", "2024-01-01"),
+            service._fetch_newsapi_articles("merger", "2024-02-01"),
+            service._fetch_newsapi_articles("fail", "2024-01-01"),
+            service._fetch_newsapi_articles("fail", "2024-01-01"),
+            return_exceptions=True,
+        )
+        assert service._newsapi_inflight == {}
+        
+        # A finished request is not reused; the next caller issues a new one
+        await service._fetch_newsapi_articles("merger", "2024-01-01")
+        return results
+    
+    results = asyncio.run(run())
+    assert results[0] == results[1] == {"status": "ok", "articles": ["merger"]}
+    assert all(isinstance(result, RuntimeError) for result in results[3:])
+    assert sorted(calls) == sorted([
+        ("merger", "2024-01-01"), ("merger", "2024-02-01"), ("fail", "2024-01-01"), ("merger", "2024-01-01"),
+    ])
+    assert service._newsapi_inflight == {}
+
+
+def test_cancelled_newsapi_caller_does_not_cancel_the_others(service):
+    async def fake_request(query, from_date):
+        await asyncio.sleep(0.02)
+        return {"status": "ok", "articles": []}
+    
+    service._request_newsapi = fake_request
+    
+    async def run():
+        first = asyncio.ensure_future(service._fetch_newsapi_articles("merger", "2024-01-01"))
+        second = asyncio.ensure_future(service._fetch_newsapi_articles("merger", "2024-01-01"))
+        await asyncio.sleep(0)
+        first.cancel()
+        result = await second
+        assert first.cancelled()
+        await asyncio.sleep(0)
+        return result
+    
+    assert asyncio.run(run()) == {"status": "ok", "articles": []}
+    assert service._newsapi_inflight == {}
@@ -0,0 +1,86 @@
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.dynamic_confidence_service import DynamicConfidenceService
+
+COMPANIES = ["Stripe", "Paystack", "OpenAI", "Microsoft", "Acme", None, ""]
+SOURCES = [
+    "sec.gov", "reuters.com", "https://www.bloomberg.com/x", "http://techcrunch.com/a",
+    "reddit.com", "Twitter", "exa_api", None, "random blog", "verified source", "",
+]
+DEAL_TYPES = ["acquisition", "merger", "partnership", "funding", "merger_acquisition", "funding_round", "ipo", None]
+DESCRIPTIONS = [
+    "Stripe acquires Nigerian fintech Paystack for $200M",
+    "HUGE DEAL!!! SomeStartup gets FUNDING!!! CLICK HERE NOW",
+    "Partners collaborate on AI",
+    "ACQUISITION OF ACME CORP BY BIGCO",
+    "They merge and combine",
+    "Limited time offer, act now",
+    "",
+]
+DEAL_VALUES = [200000000, 5e9, 3000000000, -5, "abc", "150000000", None, 0, 1.5e8]
+
+
+def _random_event(rng, now):
+    event = {}
+    for key, pool in [
+        ("source_company", COMPANIES), ("target_company", COMPANIES), ("deal_type", DEAL_TYPES),
+        ("deal_value", DEAL_VALUES), ("source", SOURCES), ("description", DESCRIPTIONS),
+    ]:
+        if rng.random() < 0.9:
+            event[key] = rng.choice(pool)
+    if rng.random() < 0.5:
+        event["source_url"] = rng.choice(SOURCES)
+    if rng.random() < 0.6:
+        event["deal_date"] = rng.choice(["2020-10-15", None])
+    if rng.random() < 0.7:
+        hours = rng.choice([0.2, 5, 50, 300, 2000])
+        event["discovered_at"] = (now - timedelta(hours=hours)).isoformat()
+    if rng.random() < 0.5:
+        event["companies_mentioned"] = rng.sample(["Stripe", "paystack", "OpenAI", "microsoft", "Acme"], 2)
+    return event
+
+
+@pytest.fixture
+def events():
+    rng = random.Random(20)
+    now = datetime.now()
+    return [_random_event(rng, now) for _ in range(150)]
+
+
+def test_batch_scores_match_scalar_scores(events):
+    service = DynamicConfidenceService()
+    batch = service.calculate_confidence_batch(events)
+    scalar = [service.calculate_confidence(event, events) for event in events]
+    assert batch.tolist() == pytest.approx(scalar, abs=1e-9)
+
+
+@pytest.mark.parametrize("size", [0, 1])
+def test_batch_without_related_events_matches_scalar(events, size):
+    service = DynamicConfidenceService()
+    batch = service.calculate_confidence_batch(events[:size])
+    assert batch.tolist() == pytest.approx(
+        [service.calculate_confidence(event) for event in events[:size]], abs=1e-9
+    )
+
+
+@pytest.mark.parametrize("with_related", [False, True])
+def test_upper_bound_never_below_full_score(events, with_related):
+    service = DynamicConfidenceService()
+    for event in events:
+        full = service.calculate_confidence(event, events if with_related else None)
+        assert service._confidence_upper_bound(event) >= full - 1e-12, event
+
+
+@pytest.mark.parametrize("threshold", [0.1, 0.3, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0])
+def test_threshold_only_skips_events_that_cannot_pass(events, threshold):
+    service = DynamicConfidenceService()
+    for event in events:
+        full = service.calculate_confidence(event, events)
+        bounded = service.calculate_confidence(event, events, min_threshold=threshold)
+        if full >= threshold:
+            assert bounded == full, event
+        else:
+            assert bounded < threshold, event
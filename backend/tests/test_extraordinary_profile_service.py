@@ -0,0 +1,123 @@
+import asyncio
+import json
+from contextlib import aclosing
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from models.extraordinary_profile import CompanyStats, ExtraordinaryProfile
+from services.extraordinary_profile_service import (
+    ExaSearchResponse, ExtraordinaryProfileService, _read_profile_file
+)
+
+
+class FakeExaClient:
+    """Stands in for ExaSearchClient, recording which searches finished or were cancelled"""
+    
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.started = []
+        self.finished = []
+        self.cancelled = []
+    
+    async def search_and_contents(self, query, **options):
+        self.started.append(query)
+        try:
+            await asyncio.sleep(0 if query == "q0" else self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(query)
+            raise
+        self.finished.append(query)
+        return ExaSearchResponse(results=[])
+    
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    service = ExtraordinaryProfileService(exa_api_key="test")
+    service.profiles_dir = tmp_path
+    service.exa_cache_path = tmp_path / "cache" / "exa_results.sqlite3"
+    service.exa_client = FakeExaClient()
+    yield service
+    asyncio.run(service.close())
+
+
+def test_stopping_early_cancels_outstanding_searches(service):
+    queries = [f"q{i}" for i in range(6)]
+    
+    async def run():
+        search_results = service._search_exa_many(queries, num_results=3)
+        async with aclosing(search_results):
+            async for query, results in search_results:
+                break
+        # Long enough for any search that was not cancelled to finish
+        await asyncio.sleep(service.exa_client.delay * 2)
+        assert service.exa_client.finished == ["q0"]
+        assert sorted(service.exa_client.cancelled) == sorted(set(service.exa_client.started) - {"q0"})
+        assert service._exa_inflight == {}
+    
+    asyncio.run(run())
+
+
+def test_search_shared_with_a_waiting_caller_keeps_running(service):
+    async def run():
+        first = asyncio.ensure_future(service._search_exa("q1", num_results=3))
+        second = asyncio.ensure_future(service._search_exa("q1", num_results=3))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        response = await second
+        await asyncio.sleep(0)
+        return response
+    
+    assert asyncio.run(run()) == ExaSearchResponse(results=[])
+    assert service.exa_client.finished == ["q1"]
+    assert service.exa_client.cancelled == []
+    assert service._exa_inflight == {}
+
+
+def test_claude_json_caches_only_object_replies(service):
+    replies = iter(['["not", "an", "object"]', '{"score": 1}', '{"score": 2}'])
+    sent = []
+    
+    async def create_claude_message(**request):
+        sent.append(request)
+        return SimpleNamespace(content=[SimpleNamespace(text=next(replies))])
+    
+    service._create_claude_message = create_claude_message
+    request = {"model": "m", "max_tokens": 10, "messages": [{"role": "user", "content": "hi"}]}
+    
+    async def run():
+        return [await service._claude_json(**request) for _ in range(3)]
+    
+    assert asyncio.run(run()) == [["not", "an", "object"], {"score": 1}, {"score": 1}]
+    assert len(sent) == 2
+
+
+def make_profile(**stats):
+    generated_at = datetime(2024, 5, 6, 7, 8, 9, 123456)
+    return ExtraordinaryProfile(
+        company_id="acme", company_name="Acme", industry="AI", profile_id="p1",
+        generated_at=generated_at, last_updated=generated_at,
+        company_stats=CompanyStats(last_updated=generated_at, **stats),
+    )
+
+
+def test_saved_profile_keeps_the_json_dump_format(service, tmp_path):
+    profile = make_profile(valuation=5_000_000_000)
+    asyncio.run(service.save_profile(profile))
+    
+    saved = (tmp_path / "acme.json").read_text()
+    assert json.loads(saved) == json.loads(json.dumps(profile.model_dump(), default=str))
+    assert '"generated_at": "2024-05-06 07:08:09.123456"' in saved
+    assert _read_profile_file(tmp_path / "acme.json") == profile
+
+
+def test_profile_with_integer_beyond_64_bits_is_saved(service, tmp_path):
+    profile = make_profile(api_calls_per_day=2 ** 70)
+    asyncio.run(service.save_profile(profile))
+    
+    assert _read_profile_file(tmp_path / "acme.json").company_stats.api_calls_per_day == 2 ** 70